@@ -0,0 +1,53 @@
+"""Compares loading a large configuration from json (direct model_validate_json path) and from yaml (python dict
+route).
+
+Run with: python -m benchmarks.bench_json_backend
+"""
+
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+from pydantic import create_model
+
+from confme import BaseConfig, source_backend
+
+SECTIONS = 200
+KEYS_PER_SECTION = 50
+
+
+def build_config_class() -> type[BaseConfig]:
+    sections = {}
+    for s in range(SECTIONS):
+        fields: dict = {f"key_{k}": (str, ...) for k in range(KEYS_PER_SECTION)}
+        sections[f"section_{s}"] = (create_model(f"Section{s}", __base__=BaseConfig, **fields), ...)
+    return create_model("LargeConfig", __base__=BaseConfig, **sections)
+
+
+def build_content() -> dict:
+    return {f"section_{s}": {f"key_{k}": f"value {s} {k}" for k in range(KEYS_PER_SECTION)} for s in range(SECTIONS)}
+
+
+def main():
+    config_cls = build_config_class()
+    content = build_content()
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = Path(folder) / "config.json"
+        json_path.write_text(json.dumps(content))
+        yaml_path = Path(folder) / "config.yaml"
+        yaml_path.write_text(yaml.safe_dump(content))
+
+        for path in (json_path, yaml_path):
+            # measure parsing and validation, not the parsed file cache
+            duration = min(
+                timeit.repeat(
+                    lambda p=path: (source_backend.clear_cache(), config_cls.load(p, argv=[])), number=5, repeat=3
+                )
+            )
+            print(f"{path.suffix:<6} {path.stat().st_size / 1024 / 1024:6.2f} MB {duration / 5 * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
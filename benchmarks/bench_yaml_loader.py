@@ -0,0 +1,43 @@
+"""Compares the libyaml (CSafeLoader) and the pure python (SafeLoader) yaml loaders on large synthetic files.
+
+Run with: python -m benchmarks.bench_yaml_loader
+"""
+
+import io
+import timeit
+from functools import partial
+
+import yaml
+
+
+def generate_yaml(sections: int, keys_per_section: int) -> str:
+    lines = []
+    for s in range(sections):
+        lines.append(f"section_{s}:")
+        for k in range(keys_per_section):
+            lines.append(f"  flag_{k}: {k % 2 == 0}")
+            lines.append(f"  route_{k}: /api/v1/section_{s}/route_{k}")
+            lines.append(f"  limit_{k}: {k * 10}")
+    return "\n".join(lines)
+
+
+def _parse(content: str, loader: type) -> None:
+    yaml.load(io.StringIO(content), Loader=loader)
+
+
+def main():
+    if not yaml.__with_libyaml__:
+        print("PyYAML was built without libyaml, CSafeLoader is not available")
+        return
+
+    for sections in (100, 400):
+        content = generate_yaml(sections, 100)
+        size_mb = len(content) / 1024 / 1024
+        for loader in (yaml.SafeLoader, yaml.CSafeLoader):
+            parse = partial(_parse, content, loader)
+            duration = min(timeit.repeat(parse, number=1, repeat=3))
+            print(f"{loader.__name__:<12} {size_mb:6.2f} MB {duration:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
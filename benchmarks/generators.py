@@ -0,0 +1,157 @@
+"""Synthetic configuration models and matching file contents for the benchmark suite.
+
+Every generator returns a Scenario with a freshly created config class, so that no compiled layouts or caches are
+shared between scenarios.
+"""
+
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import yaml
+from pydantic import create_model
+
+from confme import BaseConfig
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper  # type: ignore[assignment]
+
+
+class Scenario(NamedTuple):
+    name: str
+    config_cls: type[BaseConfig]
+    content: dict[str, Any]
+    # a few parameter paths with values, used for environment variables, arguments and update_by_str
+    overwrites: dict[str, str]
+    update_path: str
+    update_value: Any
+
+    @property
+    def leaves(self) -> int:
+        return _count_leaves(self.content)
+
+    def write(self, folder: Path) -> Path:
+        """Writes the content of the scenario as yaml file named after the scenario.
+        :param folder: folder to write the file to
+        :return: path of the written file
+        """
+        file_path = folder / f"{self.name}.yaml"
+        with open(file_path, "w") as file:
+            yaml.dump(self.content, file, Dumper=SafeDumper, sort_keys=False)
+        return file_path
+
+
+def _count_leaves(value: Any) -> int:
+    if isinstance(value, dict):
+        return sum(_count_leaves(v) for v in value.values())
+    if isinstance(value, list):
+        return sum(_count_leaves(v) for v in value)
+    return 1
+
+
+def _leaf(kind: int, i: int) -> tuple[type, Any]:
+    return [(int, i), (float, i / 7), (bool, i % 2 == 0), (str, f"value {i}")][kind % 4]
+
+
+def wide(sections: int = 100, leaves_per_section: int = 100) -> Scenario:
+    """Flat model with many sections of scalar leaves (10k leaves by default)."""
+    fields: dict[str, Any] = {}
+    content: dict[str, Any] = {}
+    for s in range(sections):
+        section_fields: dict[str, Any] = {}
+        section_content: dict[str, Any] = {}
+        for k in range(leaves_per_section):
+            annotation, value = _leaf(k, s * leaves_per_section + k)
+            section_fields[f"key_{k}"] = (annotation, ...)
+            section_content[f"key_{k}"] = value
+        fields[f"section_{s}"] = (create_model(f"WideSection{s}", __base__=BaseConfig, **section_fields), ...)
+        content[f"section_{s}"] = section_content
+
+    last = f"section_{sections - 1}"
+    return Scenario(
+        name="wide",
+        config_cls=create_model("WideConfig", __base__=BaseConfig, **fields),
+        content=content,
+        overwrites={"section_0.key_0": "1", f"{last}.key_3": "overwritten", f"{last}.key_1": "0.5"},
+        update_path=f"{last}.key_0",
+        update_value=42,
+    )
+
+
+def deep(levels: int = 50) -> Scenario:
+    """Chain of nested models, every level holds a few leaves and the next level."""
+    level_cls = create_model(f"DeepLevel{levels - 1}", __base__=BaseConfig, value=(int, ...), name=(str, ...))
+    content: dict[str, Any] = {"value": levels - 1, "name": f"level {levels - 1}"}
+    for level in range(levels - 2, -1, -1):
+        level_cls = create_model(
+            f"DeepLevel{level}", __base__=BaseConfig, value=(int, ...), name=(str, ...), child=(level_cls, ...)
+        )
+        content = {"value": level, "name": f"level {level}", "child": content}
+
+    deepest = ".".join(["child"] * (levels - 1))
+    return Scenario(
+        name="deep",
+        config_cls=create_model("DeepConfig", __base__=level_cls),
+        content=content,
+        overwrites={"value": "1", f"{deepest}.value": "2", f"{deepest}.name": "overwritten"},
+        update_path=f"{deepest}.name",
+        update_value="updated",
+    )
+
+
+def list_heavy(numbers: int = 5000, workers: int = 1000, matrix_size: int = 100) -> Scenario:
+    """Model dominated by long lists of scalars, sub-models and nested lists."""
+    worker_cls = create_model("Worker", __base__=BaseConfig, host=(str, ...), port=(int, ...), tags=(list[str], ...))
+    config_cls = create_model(
+        "ListHeavyConfig",
+        __base__=BaseConfig,
+        name=(str, ...),
+        ports=(list[int], ...),
+        workers=(list[worker_cls], ...),  # type: ignore[valid-type]
+        matrix=(list[list[float]], ...),
+    )
+    content = {
+        "name": "list heavy",
+        "ports": list(range(numbers)),
+        "workers": [{"host": f"worker-{i}", "port": 8000 + i, "tags": ["a", "b", str(i)]} for i in range(workers)],
+        "matrix": [[row * matrix_size + col / 3 for col in range(matrix_size)] for row in range(matrix_size)],
+    }
+    return Scenario(
+        name="list_heavy",
+        config_cls=config_cls,
+        content=content,
+        overwrites={"name": "overwritten", "workers.0.port": "1", "ports.10": "10"},
+        update_path="name",
+        update_value="updated",
+    )
+
+
+def string_heavy(sections: int = 20, strings_per_section: int = 100, length: int = 200) -> Scenario:
+    """Model with long string values, half of them containing path placeholders."""
+    fields: dict[str, Any] = {}
+    content: dict[str, Any] = {}
+    text = ("lorem ipsum dolor sit amet " * (length // 27 + 1))[:length]
+    for s in range(sections):
+        section_fields = {f"text_{k}": (str, ...) for k in range(strings_per_section)}
+        fields[f"section_{s}"] = (create_model(f"StringSection{s}", __base__=BaseConfig, **section_fields), ...)
+        content[f"section_{s}"] = {
+            f"text_{k}": f"%(here)s/data/{s}/{k}/{text}" if k % 2 == 0 else text for k in range(strings_per_section)
+        }
+
+    return Scenario(
+        name="string_heavy",
+        config_cls=create_model("StringHeavyConfig", __base__=BaseConfig, **fields),
+        content=content,
+        overwrites={"section_0.text_0": "overwritten", "section_1.text_1": "overwritten"},
+        update_path="section_0.text_1",
+        update_value="updated",
+    )
+
+
+SCENARIOS = {
+    "wide": wide,
+    "deep": deep,
+    "list_heavy": list_heavy,
+    "string_heavy": string_heavy,
+}
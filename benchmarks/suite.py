@@ -0,0 +1,164 @@
+"""Times every stage of the load pipeline on synthetic configurations and writes the results as JSON.
+
+Run with: python -m benchmarks.suite [--output results.json] [--compare baseline.json]
+
+Scenarios (see benchmarks.generators): wide (10k leaves), deep (50 levels), list_heavy and string_heavy. For each
+scenario the single pipeline stages (layout compilation, file parsing, path interpolation, environment and argument
+overwrites, merging and validation) and the public API (load, load_from_dict, get, get_flat_repr, update_by_str) are
+timed. Results of two runs can be compared with --compare.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from benchmarks.generators import SCENARIOS, Scenario
+from confme import source_backend
+from confme.core.argument_overwrite import argument_overwrite
+from confme.core.env_overwrite import env_overwrite
+from confme.utils.dict_util import merge
+from confme.utils.path_interpolation import interpolate_paths
+from confme.utils.typing import clear_layout_cache, get_layout
+
+
+def measure(fn: Callable[[], Any], repeat: int, min_time: float) -> dict[str, Any]:
+    """Times the given function. The number of calls per repetition is chosen such that one repetition takes at least
+    min_time seconds. One warm up call is made before timing, e.g. to fill the cache for get() hits.
+    :return: timings in seconds per call
+    """
+    fn()
+    timer = timeit.Timer(fn)
+    number = 1
+    while True:
+        duration = timer.timeit(number)
+        if duration >= min_time or number >= 1_000_000:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+    durations = [duration / number] + [t / number for t in timer.repeat(repeat=repeat - 1, number=number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min": min(durations),
+        "median": statistics.median(durations),
+        "mean": statistics.fmean(durations),
+    }
+
+
+def _benchmarks(scenario: Scenario, folder: Path) -> dict[str, Callable[[], Any]]:
+    config_cls = scenario.config_cls
+    file_path = scenario.write(folder)
+    argv = [f"++{path}={value}" for path, value in scenario.overwrites.items()]
+
+    parsed = source_backend.parse_file(file_path, interpolate=False, use_cache=False)
+    overwrites = argument_overwrite(config_cls, argv)
+    merged = merge(scenario.content, overwrites)
+    config = config_cls.load(file_path, argv=argv)
+
+    def get_miss():
+        config_cls.clear_cache()
+        source_backend.clear_cache()
+        return config_cls.get()
+
+    def load_uncached():
+        source_backend.clear_cache()
+        return config_cls.load(file_path, argv=argv)
+
+    def compile_layout():
+        clear_layout_cache()
+        return get_layout(config_cls)
+
+    config_cls.register_folder(folder, default_env=scenario.name)
+    return {
+        "compile_layout": compile_layout,
+        "parse_file": lambda: source_backend.parse_file(file_path, interpolate=False, use_cache=False),
+        "interpolate_paths": lambda: interpolate_paths(parsed, folder),
+        "env_overwrite": lambda: env_overwrite(config_cls),
+        "argument_overwrite": lambda: argument_overwrite(config_cls, argv),
+        "merge": lambda: merge(parsed, overwrites),
+        "model_validate": lambda: config_cls.model_validate(merged),
+        "load": load_uncached,
+        "load_cached_file": lambda: config_cls.load(file_path, argv=argv),
+        "load_from_dict": lambda: config_cls.load_from_dict(merged, argv=argv),
+        "get_hit": config_cls.get,
+        "get_miss": get_miss,
+        "get_flat_repr": config.get_flat_repr,
+        "update_by_str": lambda: config.update_by_str(scenario.update_path, scenario.update_value),
+    }
+
+
+def run(scenarios: list[str], benchmarks: list[str] | None, repeat: int, min_time: float) -> dict[str, Any]:
+    results: list[dict[str, Any]] = []
+    for name in scenarios:
+        scenario = SCENARIOS[name]()
+        # environment variables of the scenario are picked up by load and get
+        environ = {path: value for path, value in scenario.overwrites.items() if path not in os.environ}
+        os.environ.update(environ)
+        try:
+            with tempfile.TemporaryDirectory() as folder:
+                for benchmark, fn in _benchmarks(scenario, Path(folder)).items():
+                    if benchmarks and benchmark not in benchmarks:
+                        continue
+                    timing = measure(fn, repeat, min_time)
+                    results.append({"scenario": name, "benchmark": benchmark, "leaves": scenario.leaves, **timing})
+                    print(f"{name:<14} {benchmark:<20} {timing['median'] * 1e6:12.1f} us", file=sys.stderr)
+                scenario.config_cls.stop_watching()
+        finally:
+            for key in environ:
+                del os.environ[key]
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """Prints the ratio of the median timings of the current run to the baseline run."""
+    base = {(r["scenario"], r["benchmark"]): r["median"] for r in baseline["results"]}
+    print(f"{'scenario':<14} {'benchmark':<20} {'baseline us':>12} {'current us':>12} {'ratio':>7}", file=sys.stderr)
+    for result in current["results"]:
+        key = (result["scenario"], result["benchmark"])
+        if key not in base:
+            continue
+        ratio = result["median"] / base[key]
+        print(
+            f"{key[0]:<14} {key[1]:<20} {base[key] * 1e6:12.1f} {result['median'] * 1e6:12.1f} {ratio:7.2f}",
+            file=sys.stderr,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="scenarios to run, default all")
+    parser.add_argument("--benchmark", action="append", help="benchmarks to run, default all")
+    parser.add_argument("--repeat", type=int, default=5, help="repetitions per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimal duration of one repetition in seconds")
+    parser.add_argument("--output", type=Path, help="file to write the JSON results to, default stdout")
+    parser.add_argument("--compare", type=Path, help="JSON results of a previous run to compare against")
+    args = parser.parse_args()
+
+    results = run(args.scenario or list(SCENARIOS), args.benchmark, args.repeat, args.min_time)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
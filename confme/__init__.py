@@ -1,6 +1,6 @@
 """confme package exports"""
 
 from confme.core.base_config import BaseConfig
-from confme.utils.base_exception import ConfmeException
+from confme.utils.base_exception import ConfmeException, PreloadError
 
-__all__ = ["BaseConfig", "ConfmeException"]
+__all__ = ["BaseConfig", "ConfmeException", "PreloadError"]
@@ -0,0 +1,137 @@
+"""Compiled accessors for dot (.) separated parameter paths, used by get_by_str, update_by_str and update_many."""
+
+from collections.abc import Mapping
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from confme.utils.base_exception import ConfmeException
+from confme.utils.typing import get_layout
+
+# compiled accessors per config class and path. As for the parameter layouts, the pydantic core schema is stored
+# alongside, so that the accessors are recompiled whenever the class is rebuilt.
+_ACCESSORS: "WeakKeyDictionary[type[BaseModel], tuple[Any, dict[str, Accessor]]]" = WeakKeyDictionary()
+
+
+def _shallow_clone(model: BaseModel) -> BaseModel:
+    # cheaper than copy.copy, which also copies the private attributes and runs the __copy__ hooks of the model
+    clone = type(model).__new__(type(model))
+    object.__setattr__(clone, "__dict__", dict(object.__getattribute__(model, "__dict__")))
+    object.__setattr__(clone, "__pydantic_fields_set__", set(model.__pydantic_fields_set__))
+    object.__setattr__(clone, "__pydantic_extra__", model.__pydantic_extra__)
+    object.__setattr__(clone, "__pydantic_private__", model.__pydantic_private__)
+    return clone
+
+
+class Accessor:
+    """Compiled access path into a configuration. Every step is either the name of a model field or the index (lists
+    and tuples) or key (dicts) of a container element.
+    """
+
+    __slots__ = ("path", "steps", "_item_annotation", "_item_adapter")
+
+    def __init__(self, path: str, steps: tuple[tuple[bool, str | int], ...], item_annotation: Any):
+        self.path = path
+        # tuples of (is model field, field name or container index/key)
+        self.steps = steps
+        self._item_annotation = item_annotation
+        self._item_adapter: TypeAdapter | None = None
+
+    def get(self, instance: BaseModel) -> Any:
+        """Returns the value at the path of the given instance."""
+        return self._walk(instance, self.steps)
+
+    def prepare(self, instance: BaseModel, value: Any, validate: bool = True) -> tuple[Any, Any]:
+        """Resolves the parent of the path in the given instance and validates the value without assigning it.
+        :return: tuple of the parent object and the validated value
+        """
+        parent = self._walk(instance, self.steps[:-1])
+        if not validate:
+            return parent, value
+        is_field, key = self.steps[-1]
+        try:
+            if is_field:
+                if not isinstance(parent, BaseModel) or key not in type(parent).model_fields:
+                    raise ConfmeException(f"{self.path} not found in {type(instance).__name__}!")
+                # the field is validated like an assignment, i.e. including constraints and the field validators of
+                # the model, on a shallow clone so that nothing is applied before all updates are validated
+                validated = _shallow_clone(parent)
+                type(parent).__pydantic_validator__.validate_assignment(validated, key, value)
+                return parent, validated.__dict__[key]
+            if self._item_adapter is None:
+                self._item_adapter = TypeAdapter(self._item_annotation)
+            return parent, self._item_adapter.validate_python(value)
+        except ValidationError as e:
+            raise ConfmeException(f"Invalid value for {self.path}: {e}") from e
+
+    def assign(self, parent: Any, value: Any) -> None:
+        """Assigns the value to the last step of the path in the given parent."""
+        is_field, key = self.steps[-1]
+        try:
+            if is_field:
+                setattr(parent, key, value)  # type: ignore[arg-type]
+            else:
+                parent[key] = value
+        except (TypeError, ValueError) as e:
+            raise ConfmeException(f"Not able to update {self.path}: {e}") from e
+
+    def _walk(self, current: Any, steps: tuple[tuple[bool, str | int], ...]) -> Any:
+        try:
+            for is_field, key in steps:
+                current = getattr(current, key) if is_field else current[key]  # type: ignore[arg-type]
+        except (AttributeError, LookupError, TypeError) as e:
+            raise ConfmeException(f"{self.path} not found: {e}") from e
+        return current
+
+
+def compile_accessor(config_cls: type[BaseModel], path: str) -> Accessor:
+    """Returns the compiled accessor of the given path. Accessors are compiled once per class and path.
+    :param config_cls: config class
+    :param path: dot (.) separated parameter path, elements of lists and dicts are addressed by index or key
+    :return: compiled accessor
+    """
+    entry = _ACCESSORS.get(config_cls)
+    if entry is not None and entry[0] is getattr(config_cls, "__pydantic_core_schema__", None):
+        accessor = entry[1].get(path)
+        if accessor is not None:
+            return accessor
+
+    layout = get_layout(config_cls)
+    core_schema = getattr(config_cls, "__pydantic_core_schema__", None)
+    if entry is None or entry[0] is not core_schema:
+        entry = (core_schema, {})
+        _ACCESSORS[config_cls] = entry
+
+    node = layout.root
+    segments = layout.split(path)
+    steps: list[tuple[bool, str | int]] = []
+    for i, segment in enumerate(segments):
+        child = node.field(segment)
+        if child is not None and child.name is not None:
+            steps.append((True, child.name))
+            node = child
+        elif node.items is not None and (not node.indexed or segment.isdigit()):
+            steps.append((False, int(segment) if node.indexed else segment))
+            node = node.items
+        else:
+            raise ConfmeException(f"{segment} not found in path {'.'.join(segments[:i])}!")
+
+    accessor = Accessor(path, tuple(steps), node.annotation)
+    entry[1][path] = accessor
+    return accessor
+
+
+def update_many(instance: BaseModel, updates: Mapping[str, Any], validate: bool = True) -> None:
+    """Validates all updates first and assigns them afterwards, i.e. either all or none of the updates are applied.
+    :param instance: configuration to update
+    :param updates: dict of dot (.) separated path to its new value
+    :param validate: If False, the values are assigned without validation
+    """
+    config_cls = type(instance)
+    prepared = []
+    for path, value in updates.items():
+        accessor = compile_accessor(config_cls, path)
+        prepared.append((accessor, *accessor.prepare(instance, value, validate)))
+    for accessor, parent, value in prepared:
+        accessor.assign(parent, value)
@@ -1,33 +1,103 @@
-import argparse
+import sys
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 
-from confme.utils.dict_util import InfiniteDict, flatten
-from confme.utils.typing import get_schema
+from confme.utils.dict_util import InfiniteDict
+from confme.utils.typing import ParameterLayout, get_layout
 
+if TYPE_CHECKING:
+    import argparse
 
-def argument_overwrite(config_cls: type[BaseModel]) -> InfiniteDict:
-    # extract possible parameters
-    config_dict = get_schema(config_cls)
-    parameters: list[str] = []
-    if config_dict is not None:
-        parameters, _ = flatten(config_dict)
+HELP_ARGUMENTS = ("+h", "++help")
+
+# parsers per config class together with the layout and prefix they were built for
+_PARSER_CACHE: "WeakKeyDictionary[type[BaseModel], tuple[ParameterLayout, str, argparse.ArgumentParser]]" = (
+    WeakKeyDictionary()
+)
+# the most recently parsed argument list, so that the same command line is only parsed once per process
+_parsed_arguments: tuple[tuple[str, ...], dict[str, str]] | None = None
+
+
+def _get_parser(config_cls: type[BaseModel], layout: ParameterLayout, prefix: str) -> "argparse.ArgumentParser":
+    entry = _PARSER_CACHE.get(config_cls)
+    if entry is not None and entry[0] is layout and entry[1] == prefix:
+        return entry[2]
+
+    # argparse is only needed to print the help and therefore not imported together with confme
+    import argparse
 
-    # get arguments from command line
     parser = argparse.ArgumentParser(prefix_chars="+/")
     group = parser.add_argument_group(
         "Configuration Parameters",
         "With the parameters specified bellow, the configuration values from the config file can be overwritten.",
     )
-    for param in parameters:
-        group.add_argument(f"++{param}", required=False)
-    args, unknown = parser.parse_known_args()
+    for param in layout.parameters:
+        group.add_argument(f"++{prefix}{param}", required=False)
+    _PARSER_CACHE[config_cls] = (layout, prefix, parser)
+    return parser
+
+
+def parse_arguments(argv: Sequence[str]) -> dict[str, str]:
+    """Parses all configuration parameters passed as ++path value or ++path=value from the given argument list.
+    The result of the last argument list is cached, i.e. the command line is parsed once per process.
+    :param argv: list of command line arguments without the program name
+    :return: dict of dot (.) separated parameter path to its raw value
+    """
+    global _parsed_arguments
+    key = tuple(argv)
+    if _parsed_arguments is not None and _parsed_arguments[0] == key:
+        return _parsed_arguments[1]
+
+    arguments: dict[str, str] = {}
+    i = 0
+    while i < len(key):
+        arg = key[i]
+        i += 1
+        if not arg.startswith("++") or len(arg) <= 2:
+            continue
+        if "=" in arg:
+            path, value = arg[2:].split("=", 1)
+        elif i < len(key) and not key[i].startswith("++"):
+            path, value = arg[2:], key[i]
+            i += 1
+        else:
+            continue
+        arguments[path] = value
+
+    _parsed_arguments = (key, arguments)
+    return arguments
+
+
+def argument_overwrite(
+    config_cls: type[BaseModel], argv: Sequence[str] | None = None, prefix: str = ""
+) -> InfiniteDict:
+    """Collects all configuration parameters of the given config class which are passed as command line arguments.
+    Values are coerced based on the field types, e.g. ++ports=[80,443] is passed as list to the validation.
+    :param config_cls: config class to collect the parameters for
+    :param argv: list of command line arguments without the program name. Defaults to sys.argv[1:]
+    :param prefix: prefix of the parameter paths, e.g. if the config class is loaded from a subtree of the file
+    :return: nested dict with all parameters passed as arguments
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    layout = get_layout(config_cls)
+
+    # the parser is only needed to print the list of all configuration options
+    if any(arg in HELP_ARGUMENTS for arg in argv):
+        _get_parser(config_cls, layout, prefix).parse_known_args(argv)
 
     # find passed arguments and fill it into the dict structure
     infinite_dict = InfiniteDict()
-    for param in parameters:
-        value = getattr(args, param)
-        if value:
-            infinite_dict.expand(param.split("."), value)
+    for path, value in parse_arguments(argv).items():
+        if not value or not path.startswith(prefix):
+            continue
+        path = path[len(prefix) :]
+        resolved = layout.resolve(layout.split(path))
+        if resolved is not None:
+            segments, node = resolved
+            infinite_dict.expand(segments, node.coerce(value))
 
     return infinite_dict
@@ -0,0 +1,76 @@
+"""asyncio support for loading configurations. File reads, parsing and validation run in an executor, so that the
+event loop is not blocked. This module is imported on first use of the async API only.
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, Union
+
+if TYPE_CHECKING:
+    from confme.core.base_config import BaseConfig
+
+T = TypeVar("T")
+
+# a target is either a config class, which is loaded with get(), or a config class together with a file path
+LoadTarget = Union["type[BaseConfig]", "tuple[type[BaseConfig], Path | str]"]
+
+# loads of environments which are not cached yet, shared by concurrent aget() calls of the same event loop
+_PENDING_LOADS: "dict[tuple[type[BaseConfig], str], asyncio.Future[Any]]" = {}
+
+
+async def run_in_executor(executor: Executor | None, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Runs the given function in the executor (default executor of the loop if None) and awaits its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(fn, *args, **kwargs))
+
+
+async def coalesced_load(config_cls: "type[BaseConfig]", env: str, executor: Executor | None) -> "BaseConfig":
+    """Loads the configuration of the given environment in the executor. Concurrent calls for the same config class
+    and environment await the same load.
+    :param config_cls: config class to load
+    :param env: environment to load
+    :param executor: executor to load the configuration in, default executor of the loop if None
+    :return: loaded configuration
+    """
+    loop = asyncio.get_running_loop()
+    key = (config_cls, env)
+    future = _PENDING_LOADS.get(key)
+    if future is None or future.get_loop() is not loop:
+        future = loop.run_in_executor(executor, config_cls._get_uncached, env)
+        _PENDING_LOADS[key] = future
+        future.add_done_callback(partial(_remove_pending, key))
+    # a cancelled caller must not cancel the load of the other callers
+    return await asyncio.shield(future)
+
+
+def _remove_pending(key: "tuple[type[BaseConfig], str]", future: "asyncio.Future[Any]") -> None:
+    if _PENDING_LOADS.get(key) is future:
+        del _PENDING_LOADS[key]
+
+
+async def gather_configs(
+    *targets: LoadTarget, executor: Executor | None = None, return_exceptions: bool = False
+) -> list[Any]:
+    """Loads several configurations concurrently.
+
+    Usage:
+    ```
+    app_config, db_config = await gather_configs(AppConfig, (DatabaseConfig, 'db.yaml'))
+    ```
+    :param targets: config classes which are loaded with aget() or tuples of config class and file path which are
+    loaded with aload()
+    :param executor: executor to load the configurations in, default executor of the loop if None
+    :param return_exceptions: If True, exceptions are returned in place of the failed configurations instead of raised
+    :return: list of the loaded configurations in the order of the targets
+    """
+    awaitables = []
+    for target in targets:
+        if isinstance(target, tuple):
+            config_cls, path = target
+            awaitables.append(config_cls.aload(path, executor=executor))
+        else:
+            awaitables.append(target.aget(executor=executor))
+    return await asyncio.gather(*awaitables, return_exceptions=return_exceptions)
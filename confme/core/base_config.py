@@ -1,44 +1,290 @@
 import logging
 import os
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any, Callable, ClassVar
+from typing import TYPE_CHECKING, Any, Callable, ClassVar
 
-from pydantic import BaseModel
-from tabulate import tabulate
+from pydantic import BaseModel, PrivateAttr, ValidationError
 from typing_extensions import Self
 
 from confme import source_backend
+from confme.core.accessors import compile_accessor, update_many
 from confme.core.argument_overwrite import argument_overwrite
+from confme.core.config_cache import CacheStats, ConfigCache
+from confme.core.config_watcher import ChangeCallback, ConfigWatcher
+from confme.core.env_index import EnvFileIndex
 from confme.core.env_overwrite import env_overwrite
-from confme.utils.base_exception import ConfmeException
-from confme.utils.dict_util import flatten, recursive_update
+from confme.core.lazy_validation import discard_section, section_fields, validate_lazy, validate_section
+from confme.utils.base_exception import ConfmeException, PreloadError
+from confme.utils.dict_util import LIST_POLICIES, ListPolicy, deep_copy, flatten, merge
+from confme.utils.instrumentation import (
+    ARGUMENT_OVERWRITE,
+    ENV_OVERWRITE,
+    MERGE,
+    PARSE_FILE,
+    SNAPSHOT,
+    VALIDATE,
+    count_leaves,
+    current_report,
+    observe_load,
+    stage,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 
 class BaseConfig(BaseModel):
     __KEY_LOOKUP__: ClassVar[list[str]] = ["env", "environment", "environ", "stage"]
     __config_path__: ClassVar[Path | None] = None
     __default_env__: ClassVar[str | None] = None
-    __cache__: ClassVar[dict[str, "BaseConfig"]] = {}
+    __env_index__: ClassVar[EnvFileIndex | None] = None
+    __env__: ClassVar[str | None] = None
+    __cache__: ClassVar[ConfigCache] = ConfigCache()
+    __env_prefix__: ClassVar[str] = ""
+    __env_nested_delimiter__: ClassVar[str] = "."
+    __watcher__: ClassVar[ConfigWatcher | None] = None
+    __subscribers__: ClassVar[list[ChangeCallback]] = []
+    __lazy__: ClassVar[bool] = False
+    __config_select__: ClassVar[str | None] = None
+    __snapshot_dir__: ClassVar[Path | str | None] = None
+    __list_policy__: ClassVar[ListPolicy] = "replace"
+    __base_layers__: ClassVar[tuple[Path, ...]] = ()
+    __override_layers__: ClassVar[tuple[Path, ...]] = ()
+
+    _lazy_sections: dict[str, Any] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # every config class gets its own cache and environment, so that unrelated classes never share instances
+        cls.__cache__ = ConfigCache()
+        cls.__env__ = None
 
     @classmethod
-    def load(cls, path: Path | str) -> Self:
+    def load(
+        cls,
+        path: Path | str | Sequence[Path | str],
+        argv: Sequence[str] | None = None,
+        lazy: bool | None = None,
+        select: str | None = None,
+        snapshot_dir: Path | str | None = None,
+        list_policy: ListPolicy | None = None,
+    ) -> Self:
         """Load your configuration file into your config class structure.
         :param config_class: Root class to map the configuration file to
-        :param path: path to configuration file
+        :param path: path to configuration file or list of configuration files (layers), e.g. a shared base file
+        followed by the file of the environment and local overrides. Later layers overwrite the values of earlier ones.
+        The parsed layers are cached and shared between loads instead of copied.
+        :param argv: command line arguments (without program name) to overwrite parameters. Defaults to sys.argv[1:]
+        :param lazy: If True, nested config sections are validated on first access. Defaults to __lazy__ of the class.
+        :param select: dot (.) separated path of the subtree in the file to load into the config class. Environment
+        variables and command line arguments keep their full path. Defaults to __config_select__ of the class.
+        :param snapshot_dir: If set, the validated configuration is stored in this directory and rebuilt without
+        parsing and validation as long as the file, the config class and the overwrites don't change. Defaults to
+        __snapshot_dir__ of the class.
+        :param list_policy: How lists of later layers are merged into the lists of earlier layers: replace or append.
+        Defaults to __list_policy__ of the class.
         :return: instance of config_class with all values added from the config file
         """
-        config_content = source_backend.parse_file(path)
-        config_content = recursive_update(config_content, env_overwrite(cls))
-        config_content = recursive_update(config_content, argument_overwrite(cls))
+        select = cls.__config_select__ if select is None else select
+        lazy = cls.__lazy__ if lazy is None else lazy
+        list_policy = cls.__list_policy__ if list_policy is None else list_policy
+        if list_policy not in LIST_POLICIES:
+            raise ConfmeException(f"Unknown list policy {list_policy}, supported are: {', '.join(LIST_POLICIES)}")
+        layers = [path] if isinstance(path, (str, Path)) else list(path)
+        if not layers:
+            raise ConfmeException("At least one configuration file is required")
+        select_path = select.split(".") if select else None
+        with observe_load(cls, path=", ".join(str(layer) for layer in layers)):
+            with stage(ENV_OVERWRITE):
+                env_overwrites = cls._env_overwrite(select_path)
+            with stage(ARGUMENT_OVERWRITE):
+                argument_overwrites = argument_overwrite(cls, argv, prefix=f"{select}." if select else "")
+
+            snapshot_dir = cls.__snapshot_dir__ if snapshot_dir is None else snapshot_dir
+            snapshot: tuple[Path, str] | None = None
+            if snapshot_dir is not None:
+                # pickle and tempfile are only imported if snapshots are used
+                from confme.core.snapshot import load_snapshot, snapshot_key
 
-        return cls.model_validate(config_content)
+                with stage(SNAPSHOT):
+                    snapshot = (
+                        Path(snapshot_dir),
+                        snapshot_key(
+                            cls,
+                            [Path(layer) for layer in layers],
+                            select,
+                            list_policy,
+                            env_overwrites,
+                            argument_overwrites,
+                        ),
+                    )
+                    config = load_snapshot(*snapshot, model_cls=cls)
+                if config is not None:
+                    return config
+
+            raw_json = None
+            if len(layers) == 1 and not select_path and not env_overwrites and not argument_overwrites and not lazy:
+                with stage(PARSE_FILE):
+                    raw_json = source_backend.read_json(layers[0])
+            if raw_json is not None:
+                report = current_report()
+                if report is not None:
+                    report.bytes += len(raw_json)
+                # nothing to merge into the file content, let pydantic parse and validate the json in one go
+                with stage(VALIDATE):
+                    config = cls.model_validate_json(raw_json)
+            else:
+                # the cached layers are shared and merged without copies. The merged content is copied once, as
+                # pydantic keeps Any typed values (e.g. dicts) by reference and the cache must not be aliased.
+                config_content = source_backend.parse_file(layers[0], select=select_path, copy=False)
+                for layer in layers[1:]:
+                    layer_content = source_backend.parse_file(layer, select=select_path, copy=False)
+                    with stage(MERGE):
+                        config_content = merge(config_content, layer_content, list_policy)
+                with stage(MERGE):
+                    config_content = merge(config_content, env_overwrites)
+                    config_content = deep_copy(merge(config_content, argument_overwrites))
+                config = cls._validate(config_content, lazy)
+
+            if snapshot is not None:
+                from confme.core.snapshot import save_snapshot
+
+                with stage(SNAPSHOT):
+                    save_snapshot(*snapshot, model=config)
+            return config
 
     @classmethod
-    def load_from_dict(cls, config_content: dict[str, Any]) -> Self:
-        config_content = recursive_update(config_content, env_overwrite(cls))
-        config_content = recursive_update(config_content, argument_overwrite(cls))
+    async def aload(
+        cls,
+        path: Path | str | Sequence[Path | str],
+        argv: Sequence[str] | None = None,
+        lazy: bool | None = None,
+        select: str | None = None,
+        snapshot_dir: Path | str | None = None,
+        list_policy: ListPolicy | None = None,
+        executor: "Executor | None" = None,
+    ) -> Self:
+        """Async version of load(). Reading, parsing and validating the file runs in the executor, so that the event
+        loop is not blocked. See load() for the parameters.
+        :param executor: executor to load the configuration in, default executor of the event loop if None
+        :return: instance of config_class with all values added from the config file
+        """
+        from confme.core.async_loading import run_in_executor
+
+        return await run_in_executor(
+            executor,
+            cls.load,
+            path,
+            argv=argv,
+            lazy=lazy,
+            select=select,
+            snapshot_dir=snapshot_dir,
+            list_policy=list_policy,
+        )
+
+    @classmethod
+    def load_from_dict(
+        cls, config_content: dict[str, Any], argv: Sequence[str] | None = None, lazy: bool | None = None
+    ) -> Self:
+        with observe_load(cls):
+            with stage(ENV_OVERWRITE):
+                env_overwrites = cls._env_overwrite()
+            with stage(ARGUMENT_OVERWRITE):
+                argument_overwrites = argument_overwrite(cls, argv)
+            with stage(MERGE):
+                config_content = merge(config_content, env_overwrites)
+                config_content = merge(config_content, argument_overwrites)
+
+            return cls._validate(config_content, lazy)
+
+    @classmethod
+    def _validate(cls, config_content: dict[str, Any], lazy: bool | None) -> Self:
+        report = current_report()
+        if report is not None:
+            report.leaves += count_leaves(config_content)
+        with stage(VALIDATE):
+            if cls.__lazy__ if lazy is None else lazy:
+                return validate_lazy(cls, config_content)
+            return cls.model_validate(config_content)
+
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, item: str) -> Any:
+            # pending sections of lazily loaded configs are not part of __dict__ until they are validated
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private:
+                pending = private.get("_lazy_sections")
+                if pending and item in pending:
+                    return validate_section(self, item)
+            return super().__getattr__(item)
 
-        return cls.model_validate(config_content)
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # an assigned section replaces the pending raw content of a lazily loaded config
+        private = self.__pydantic_private__
+        if private and private.get("_lazy_sections"):
+            discard_section(self, name)
+
+    def validate_all(self) -> Self:
+        """Validates all pending sections of a lazily loaded configuration (see load), e.g. to check the whole
+        configuration in CI.
+        :return: self
+        """
+        if self._lazy_sections:
+            for name in list(self._lazy_sections):
+                getattr(self, name)
+        for name in section_fields(type(self)):
+            section = self.__dict__.get(name)
+            if isinstance(section, BaseConfig):
+                section.validate_all()
+        return self
+
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        # copies validate their pending sections independently of the original
+        if self._lazy_sections:
+            copied._lazy_sections = dict(self._lazy_sections)
+        return copied
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, BaseConfig):
+            try:
+                self.validate_all()
+                other.validate_all()
+            except ValidationError:
+                # configurations with invalid pending sections are only equal to themselves
+                return self is other
+        return super().__eq__(other)
+
+    def __repr_args__(self) -> Any:
+        pending = self._lazy_sections
+        if not pending:
+            return super().__repr_args__()
+        for name in list(pending):
+            try:
+                getattr(self, name)
+            except ValidationError:
+                # invalid sections are shown with their raw content
+                pass
+        args = list(super().__repr_args__())
+        args.extend((self._lazy_sections or {}).items())
+        positions = {name: i for i, name in enumerate(type(self).model_fields)}
+        return sorted(args, key=lambda arg: positions.get(arg[0] or "", len(positions)))
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return super(BaseConfig, self.validate_all()).model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return super(BaseConfig, self.validate_all()).model_dump_json(**kwargs)
+
+    @classmethod
+    def _env_overwrite(cls, select_path: list[str] | None = None):
+        prefix = cls.__env_prefix__
+        if select_path:
+            prefix += cls.__env_nested_delimiter__.join(select_path) + cls.__env_nested_delimiter__
+        return env_overwrite(cls, prefix=prefix, nested_delimiter=cls.__env_nested_delimiter__)
 
     @classmethod
     def register_folder(
@@ -46,51 +292,233 @@ class BaseConfig(BaseModel):
         config_folder: Path,
         default_env: str | None = None,
         strict: bool = False,
+        watch: bool = False,
+        poll_interval: float = 1.0,
+        cache_size: int | None = None,
+        cache_ttl: float | None = None,
+        base_layers: Sequence[Path | str] = (),
+        override_layers: Sequence[Path | str] = (),
     ) -> None:
         """Register a folder where configuration files are drawn based on the environment.
         :param config_folder: Path to the folder with configuration files per environment
         :param default_env: Default environment that should be used if none is specified via environment variable
         :param strict: If True, an exception is raised if no configuration file is found that exactly matches env name.
+        :param watch: If True, the folder is watched and changed configuration files are reloaded in the background.
+        :param poll_interval: Seconds between two checks of the folder if watch is True.
+        :param cache_size: Maximum number of cached environments. The least recently used environment is evicted first.
+        :param cache_ttl: Seconds after which a cached environment is re-read on the next access.
+        :param base_layers: Files (relative to config_folder) loaded below the file of every environment, e.g.
+        base.yaml with the values shared by all environments. They are parsed once and shared between environments.
+        :param override_layers: Files (relative to config_folder) loaded on top of the file of every environment if they
+        exist, e.g. a local.yaml with the overrides of a developer machine.
         """
+        cls.stop_watching()
         cls.__config_path__ = config_folder
+        cls.__base_layers__ = tuple(Path(config_folder) / layer for layer in base_layers)
+        cls.__override_layers__ = tuple(Path(config_folder) / layer for layer in override_layers)
         cls.__default_env__ = default_env
-        cls._strict = strict
-        cls.__cache__ = {}
+        cls.__env_index__ = EnvFileIndex(config_folder, strict)
+        cls.__env__ = None
+        cls.__cache__ = ConfigCache(cache_size, cache_ttl)
+        if watch:
+            cls.__watcher__ = ConfigWatcher(cls, poll_interval)
+            cls.__watcher__.start()
+
+    @classmethod
+    def cache_stats(cls) -> CacheStats:
+        """Returns the statistics of the configuration cache used by get().
+        :return: hit, miss, eviction and expiration counters together with the size and settings of the cache
+        """
+        return cls.__cache__.stats()
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Removes all configurations cached by get(), so that they are loaded again on the next access."""
+        cls.__cache__.clear()
+
+    @classmethod
+    def stop_watching(cls) -> None:
+        """Stops watching the registered folder for changes."""
+        watcher = cls.__dict__.get("__watcher__")
+        if watcher is not None:
+            watcher.stop()
+            cls.__watcher__ = None
+
+    @classmethod
+    def subscribe(cls, callback: ChangeCallback) -> None:
+        """Subscribe to configuration changes of a watched folder (see register_folder).
+        :param callback: called with the environment, the new configuration and the set of changed keys
+        """
+        if "__subscribers__" not in cls.__dict__:
+            cls.__subscribers__ = []
+        cls.__subscribers__.append(callback)
+
+    @classmethod
+    def unsubscribe(cls, callback: ChangeCallback) -> None:
+        """Removes a callback registered with subscribe.
+        :param callback: callback to remove
+        """
+        if callback in cls.__dict__.get("__subscribers__", []):
+            cls.__subscribers__.remove(callback)
+
+    @classmethod
+    def _notify(cls, env: str, config: "BaseConfig", keys: set[str]) -> None:
+        for callback in list(cls.__dict__.get("__subscribers__", [])):
+            try:
+                callback(env, config, keys)
+            except Exception:
+                logging.exception(f"Configuration change callback {callback} failed")
 
     @classmethod
     def get(cls) -> Self:
         """Get the corresponding configuration based on the environment. Thereby, the configuration class is loaded
-        once and cached for subsequent calls.
+        once and cached for subsequent calls. Concurrent calls for an environment which is not cached yet wait for a
+        single load. The environment is resolved on first use and pinned afterwards, call refresh_env() after changing
+        the environment variables.
         :return: instance of config_class with all values added from the config file
         """
+        env = cls.__env__
+        if env is None:
+            env = cls.refresh_env()
+        config = cls.__cache__.get(env)
+        if config is None:
+            config = cls._get_uncached(env)
+
+        return config  # type: ignore[return-value]
+
+    @classmethod
+    async def aget(cls, executor: "Executor | None" = None) -> Self:
+        """Async version of get(). On a cache miss the configuration is loaded in the executor, concurrent calls for
+        the same environment share one load.
+        :param executor: executor to load the configuration in, default executor of the event loop if None
+        :return: instance of config_class with all values added from the config file
+        """
+        env = cls.__env__
+        if env is None:
+            env = cls.refresh_env()
+        config = cls.__cache__.get(env)
+        if config is None:
+            from confme.core.async_loading import coalesced_load
+
+            config = await coalesced_load(cls, env, executor)
+
+        return config  # type: ignore[return-value]
+
+    @classmethod
+    def refresh_env(cls) -> str:
+        """Resolves the environment from the environment variables (or the default environment) again and pins it
+        for subsequent get() calls.
+        :return: name of the resolved environment
+        """
         env = cls._get_current_env()
-        if env not in cls.__cache__:
-            cls.__cache__[env] = cls._load_file(env)
+        cls.__env__ = env
+        return env
 
-        return cls.__cache__[env]  # type: ignore[return-value]
+    @classmethod
+    def pin_env(cls, env: str) -> None:
+        """Pins the environment used by get() independent of the environment variables.
+        :param env: name of the environment
+        """
+        cls.__env__ = env
 
     @classmethod
-    def _load_file(cls, environment: str) -> Self:
-        if cls.__config_path__ is None:
+    def preload_all(cls, executor: "Executor | None" = None) -> dict[str, Self]:
+        """Loads the configuration of every environment in the registered folder in parallel and fills the cache.
+        Every file with a known file ending is an environment named after the file stem. The configurations are also
+        cached under the current environment and already cached environments which resolve to one of the files (e.g.
+        prod for my_prod_config.yaml). All environments are loaded, even if some of them fail, and the failures are
+        reported together.
+        :param executor: executor to load the environments in, e.g. a ProcessPoolExecutor to validate large
+        configurations on several cores. Defaults to a thread pool which is shut down afterwards.
+        :return: dict of environment name to its configuration
+        """
+        env_index = cls.__env_index__
+        if env_index is None:
             raise ConfmeException("Config path not set. Call register_folder() first.")
-        files = list(cls.__config_path__.glob(pattern="*"))
-        if cls._strict:
-            selected_files = [f for f in files if f.name == environment or f.stem == environment]
-        else:
-            selected_files = [f for f in files if environment in f.name]
-
-        if len(selected_files) <= 0:
-            raise ConfmeException(f"No configuration found for environment {environment} in files {files}")
-        elif len(selected_files) > 1:
-            logging.warning(
-                f"More than one file found matching environment {environment} in"
-                f"files {files}. Using file {selected_files[0]}"
-            )
-            file = selected_files[0]
-        else:
-            file = selected_files[0]
+        endings = set(source_backend.registered_endings())
+        layers = set(cls.__base_layers__ + cls.__override_layers__)
+        files: dict[str, Path] = {}
+        for file in env_index.files():
+            if file.suffix.lower() in endings and file not in layers:
+                files.setdefault(file.stem, file)
+
+        from concurrent.futures import ThreadPoolExecutor
 
-        return cls.load(file)
+        pool = executor or ThreadPoolExecutor(max_workers=min(32, len(files) or 1), thread_name_prefix="confme-preload")
+        configs: dict[str, Self] = {}
+        errors: dict[str, Exception] = {}
+        try:
+            futures = {env: pool.submit(cls.load, cls._layers(file)) for env, file in files.items()}
+            for env, future in futures.items():
+                try:
+                    configs[env] = future.result()
+                except Exception as e:
+                    errors[env] = e
+        finally:
+            if executor is None:
+                pool.shutdown()
+
+        for env, config in configs.items():
+            cls.__cache__[env] = config
+        cls._cache_aliases(env_index, {files[env]: config for env, config in configs.items()})
+        if errors:
+            raise PreloadError(errors)
+        return configs
+
+    @classmethod
+    def _cache_aliases(cls, env_index: EnvFileIndex, configs: "dict[Path, BaseConfig]") -> None:
+        # get() resolves environments which are no exact file stem (e.g. prod for my_prod_config.yaml) by ranking the
+        # files, so the current and already cached environments are stored under the name get() looks up as well
+        env = cls.__env__
+        if env is None:
+            try:
+                env = cls._get_current_env()
+            except Exception:
+                env = None
+        aliases = set(cls.__cache__.keys())
+        if env is not None:
+            aliases.add(env)
+        for alias in aliases:
+            try:
+                config = configs.get(env_index.resolve(alias))
+            except ConfmeException:
+                continue
+            if config is not None:
+                cls.__cache__[alias] = config
+
+    @classmethod
+    def _get_uncached(cls, env: str) -> "BaseConfig":
+        with observe_load(cls, env=env):
+            return cls._load_single_flight(env)
+
+    @classmethod
+    def _load_single_flight(cls, env: str) -> "BaseConfig":
+        with cls.__cache__.single_flight(env):
+            # another thread might have loaded the configuration while we were waiting for the lock
+            config = cls.__cache__.get(env, record=False)
+            if config is None:
+                config = cls._load_file(env)
+                cls.__cache__[env] = config
+        return config
+
+    @classmethod
+    def _load_file(cls, environment: str) -> Self:
+        return cls.load(cls._layers(cls._resolve_file(environment)))
+
+    @classmethod
+    def _layers(cls, file: Path) -> list[Path]:
+        """Returns all files the configuration of an environment is loaded from.
+        :param file: configuration file of the environment
+        :return: base layers, the given file and the existing override layers
+        """
+        return [*cls.__base_layers__, file, *(layer for layer in cls.__override_layers__ if layer.exists())]
+
+    @classmethod
+    def _resolve_file(cls, environment: str) -> Path:
+        env_index = cls.__env_index__
+        if env_index is None:
+            raise ConfmeException("Config path not set. Call register_folder() first.")
+        return env_index.resolve(environment)
 
     @classmethod
     def _get_current_env(cls) -> str:
@@ -112,9 +540,17 @@ class BaseConfig(BaseModel):
 
         return os.environ[key].lower()
 
-    def update_by_str(self, path: str, value: Any) -> None:
+    def get_by_str(self, path: str) -> Any:
+        """Given a path string separated by dots (.) this method returns the value of nested configuration objects.
+        Elements of lists and dicts are addressed by their index or key, e.g. config.get_by_str('workers.0.host').
+        :param path: dot (.) separated string of the value to return
+        :return: value at the given path
+        """
+        return compile_accessor(type(self), path).get(self)
+
+    def update_by_str(self, path: str, value: Any, validate: bool = True) -> None:
         """Given a path string separated by dots (.) this method allows to update nested configuration objects.
-        CAVEAT: For this update no type check is applied!
+        The value is validated (and coerced, e.g. '8080' to 8080) against the type and constraints of the field.
         e.g. given this configuration
         ```
         class DatabaseConfig(BaseConfig):
@@ -131,19 +567,19 @@ class BaseConfig(BaseModel):
         config.update_by_str('database.host', 'my new host')
         :param path: dot (.) separated string which value should be updated
         :param value: update value
+        :param validate: If False, the value is assigned without type check
         """
-        path_parts = path.split(".")
-        current = self
-        for i, segment in enumerate(path_parts):
-            if not hasattr(current, segment):
-                raise ConfmeException(f"{segment} not found in path {'.'.join(path_parts[:i])}!")
+        accessor = compile_accessor(type(self), path)
+        accessor.assign(*accessor.prepare(self, value, validate))
 
-            # for the last item we don't want to assign it to the current element because we want to assign the given
-            # value instead
-            if i + 1 < len(path_parts):
-                current = getattr(current, segment)
-            else:
-                setattr(current, segment, value)
+    def update_many(self, updates: Mapping[str, Any], validate: bool = True) -> None:
+        """Updates several values at once, e.g. config.update_many({'database.host': 'db', 'database.port': 5432}).
+        All values are validated before the first one is assigned, so that an invalid value leaves the configuration
+        unchanged.
+        :param updates: dict of dot (.) separated path to its new value
+        :param validate: If False, the values are assigned without type check
+        """
+        update_many(self, updates, validate)
 
     def get_flat_repr(self) -> list[tuple[str, Any]]:
         """Returns a flat representation of your configuration structure (tree).
@@ -175,6 +611,8 @@ class BaseConfig(BaseModel):
         """Prints/logs the configuration in a flat format.
         :param print_fn: print callable to overwrite can be used e.g. with log_config(print_fn=print)
         """
+        from tabulate import tabulate
+
         flat_config = self.get_flat_repr()
         str_config = tabulate(flat_config, headers=["Key", "Value"], tablefmt="github")
         print_fn(str_config)
@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from confme.core.base_config import BaseConfig
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    current_size: int
+    max_size: int | None
+    ttl: float | None
+
+
+class ConfigCache:
+    """Cache of loaded configurations per environment. Every config class owns its own cache. Optionally, the
+    number of cached environments is bounded (least recently used environments are evicted first) and entries expire
+    after ttl seconds, so that they are re-read on the next access.
+    """
+
+    __slots__ = (
+        "max_size",
+        "ttl",
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "_data",
+        "_expires",
+        "_load_locks",
+        "_load_locks_lock",
+    )
+
+    def __init__(self, max_size: int | None = None, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._data: OrderedDict[str, BaseConfig] = OrderedDict()
+        self._expires: dict[str, float] = {}
+        # lock and number of waiting loads per environment, dropped as soon as no load is waiting anymore
+        self._load_locks: dict[str, tuple[threading.Lock, list[int]]] = {}
+        self._load_locks_lock = threading.Lock()
+
+    def get(self, env: str, record: bool = True) -> "BaseConfig | None":
+        """Returns the cached configuration of the given environment.
+        :param env: name of the environment
+        :param record: If False, the lookup is not counted in the statistics
+        :return: cached configuration or None if it is not cached or expired
+        """
+        config = self._data.get(env)
+        if config is not None and self.ttl is not None and self._expires.get(env, 0.0) <= time.monotonic():
+            self._data.pop(env, None)
+            self.expirations += 1
+            config = None
+        if config is None:
+            self.misses += record
+            return None
+        if self.max_size is not None:
+            try:
+                self._data.move_to_end(env)
+            except KeyError:
+                pass
+        self.hits += record
+        return config
+
+    def __getitem__(self, env: str) -> "BaseConfig":
+        return self._data[env]
+
+    def __setitem__(self, env: str, config: "BaseConfig") -> None:
+        if self.ttl is not None:
+            self._expires[env] = time.monotonic() + self.ttl
+        self._data[env] = config
+        self._data.move_to_end(env)
+        while self.max_size is not None and len(self._data) > self.max_size:
+            evicted, _ = self._data.popitem(last=False)
+            self._expires.pop(evicted, None)
+            self.evictions += 1
+
+    def __contains__(self, env: str) -> bool:
+        return env in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self) -> list[str]:
+        return list(self._data.keys())
+
+    @contextmanager
+    def single_flight(self, env: str) -> Iterator[None]:
+        """Serializes the loads of the given environment, so that concurrent cache misses load it only once.
+        :param env: name of the environment
+        """
+        with self._load_locks_lock:
+            entry = self._load_locks.get(env)
+            if entry is None:
+                entry = self._load_locks[env] = (threading.Lock(), [0])
+            entry[1][0] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._load_locks_lock:
+                entry[1][0] -= 1
+                if not entry[1][0]:
+                    del self._load_locks[env]
+
+    def clear(self) -> None:
+        """Removes all cached configurations."""
+        self._data.clear()
+        self._expires.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the statistics of the cache.
+        :return: hit, miss, eviction and expiration counters together with the size and settings of the cache
+        """
+        return CacheStats(
+            self.hits, self.misses, self.evictions, self.expirations, len(self._data), self.max_size, self.ttl
+        )
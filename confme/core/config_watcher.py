@@ -0,0 +1,101 @@
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from confme.core.base_config import BaseConfig
+
+ChangeCallback = Callable[[str, "BaseConfig", set[str]], None]
+
+
+def changed_keys(old: "BaseConfig", new: "BaseConfig") -> set[str]:
+    """Compares the flat representation of two configurations.
+    :param old: previous configuration
+    :param new: new configuration
+    :return: set of dot (.) separated keys which were added, removed or changed
+    """
+    old_flat = dict(old.get_flat_repr())
+    new_flat = dict(new.get_flat_repr())
+    keys = old_flat.keys() ^ new_flat.keys()
+    keys.update(k for k in old_flat.keys() & new_flat.keys() if old_flat[k] != new_flat[k])
+    return keys
+
+
+class ConfigWatcher:
+    """Watches the folder registered on a config class by polling the modification time and size of its files. If
+    a file of an already loaded environment changes, it is reloaded in the background, the cached instance is swapped
+    and all subscribers are notified with the changed keys. If the new file can't be loaded, the last good
+    configuration stays in service.
+    """
+
+    def __init__(self, config_cls: type["BaseConfig"], poll_interval: float = 1.0):
+        self.config_cls = config_cls
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int]]:
+        folder = self.config_cls.__config_path__
+        snapshot: dict[Path, tuple[int, int]] = {}
+        if folder is None:
+            return snapshot
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    stat = entry.stat()
+                    snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def start(self) -> None:
+        """Starts polling in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"confme-watcher-{self.config_cls.__name__}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops polling and waits for the polling thread to finish."""
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception:
+                logging.exception(f"Checking configuration folder of {self.config_cls.__name__} failed")
+
+    def check(self) -> None:
+        """Runs a single polling round and reloads all loaded environments whose files changed."""
+        snapshot = self._scan()
+        changed_files = {p for p in snapshot.keys() | self._snapshot.keys() if snapshot.get(p) != self._snapshot.get(p)}
+        self._snapshot = snapshot
+        if not changed_files:
+            return
+
+        cache = self.config_cls.__cache__
+        for env in list(cache.keys()):
+            try:
+                file = self.config_cls._resolve_file(env)
+                # a changed base or override layer (including created or deleted overrides) affects all environments
+                if changed_files.isdisjoint(
+                    (file, *self.config_cls.__base_layers__, *self.config_cls.__override_layers__)
+                ):
+                    continue
+                new_config = self.config_cls.load(self.config_cls._layers(file))
+            except Exception:
+                logging.exception(f"Reloading configuration of environment {env} failed, keeping last good config")
+                continue
+
+            old_config = cache[env]
+            cache[env] = new_config
+            keys = changed_keys(old_config, new_config)
+            if keys:
+                self.config_cls._notify(env, new_config, keys)
@@ -0,0 +1,86 @@
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+
+from confme.utils.base_exception import ConfmeException
+
+_TOKEN_SEPARATOR = re.compile(r"[^0-9a-zA-Z]+")
+
+
+class EnvFileIndex:
+    """Index of the configuration files in a registered folder. Environments are matched against the files in the
+    following order: exact file name or stem, prefix of the file name, separated token of the stem (e.g. prod in
+    my_prod_config.yaml) and substring of the file name. Within a rank, the first file in alphabetical order wins. In
+    strict mode, only exact matches are accepted. Resolved environments are memoized and the index is rebuilt if the
+    modification time of the folder changes, i.e. if files are added, removed or renamed.
+    """
+
+    def __init__(self, folder: Path, strict: bool = False):
+        self.folder = folder
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._mtime_ns: int | None = None
+        self._files: list[Path] = []
+        self._exact: dict[str, Path] = {}
+        self._resolved: dict[str, Path] = {}
+
+    def _refresh(self) -> None:
+        mtime_ns = os.stat(self.folder).st_mtime_ns
+        if mtime_ns == self._mtime_ns:
+            return
+
+        files = sorted((Path(e.path) for e in os.scandir(self.folder) if e.is_file()), key=lambda f: f.name)
+        exact: dict[str, Path] = {}
+        for f in files:
+            exact.setdefault(f.stem, f)
+        for f in files:
+            exact[f.name] = f
+        self._files = files
+        self._exact = exact
+        self._resolved = {}
+        self._mtime_ns = mtime_ns
+
+    def files(self) -> list[Path]:
+        """Returns all files of the folder in alphabetical order.
+        :return: list of files
+        """
+        with self._lock:
+            self._refresh()
+            return list(self._files)
+
+    def resolve(self, environment: str) -> Path:
+        """Returns the configuration file of the given environment.
+        :param environment: name of the environment
+        :return: path to the configuration file
+        """
+        with self._lock:
+            self._refresh()
+            file = self._resolved.get(environment)
+            if file is None:
+                file = self._match(environment)
+                self._resolved[environment] = file
+            return file
+
+    def _match(self, environment: str) -> Path:
+        file = self._exact.get(environment)
+        if file is not None:
+            return file
+
+        if not self.strict:
+            ranked = (
+                [f for f in self._files if f.name.startswith(environment)],
+                [f for f in self._files if environment in _TOKEN_SEPARATOR.split(f.stem)],
+                [f for f in self._files if environment in f.name],
+            )
+            for selected_files in ranked:
+                if len(selected_files) > 1:
+                    logging.warning(
+                        f"More than one file found matching environment {environment} in "
+                        f"files {selected_files}. Using file {selected_files[0]}"
+                    )
+                if selected_files:
+                    return selected_files[0]
+
+        raise ConfmeException(f"No configuration found for environment {environment} in files {self._files}")
@@ -1,27 +1,48 @@
 import os
+import re
 
 from pydantic import BaseModel
 
-from confme.utils.dict_util import InfiniteDict, flatten
-from confme.utils.typing import get_schema
+from confme.utils.dict_util import InfiniteDict
+from confme.utils.typing import get_layout
 
 
-def env_overwrite(config_cls: type[BaseModel]) -> InfiniteDict:
-    # extract possible parameters
-    config_dict = get_schema(config_cls)
-    parameters: list[str] = []
-    if config_dict is not None:
-        parameters, _ = flatten(config_dict)
+def env_overwrite(config_cls: type[BaseModel], prefix: str = "", nested_delimiter: str = ".") -> InfiniteDict:
+    """Collects all configuration parameters of the given config class which are set as environment variables.
+    Environment variable names are case insensitive and consist of the prefix followed by the parameter path, where
+    the nesting levels are separated by nested_delimiter (e.g. APP__DATABASE__HOST).
+    :param config_cls: config class to collect the parameters for
+    :param prefix: prefix of the environment variable names
+    :param nested_delimiter: separator between the nesting levels of a parameter
+    :return: nested dict with all parameters found in the environment
+    """
+    layout = get_layout(config_cls)
 
     # make env variables case insensitive
-    keys, values = zip(*os.environ.items())
-    keys = [k.casefold() for k in keys]
+    environ = {k.casefold(): v for k, v in os.environ.items()}
 
     # find passed arguments and fill it into the dict structure
     infinite_dict = InfiniteDict()
-    for p in parameters:
-        if p.casefold() in keys:
-            i = keys.index(p.casefold())
-            infinite_dict.expand(p.split("."), values[i])
+    env_keys = layout.folded_keys(prefix, nested_delimiter)
+    for key, segments in env_keys.items():
+        value = environ.get(key)
+        if value is not None:
+            infinite_dict.expand(segments, value)
+
+    # indexed paths into containers and paths into recursive models are resolved in the parameter trie. Only field
+    # names are matched case insensitive, mapping keys keep the case of the environment variable name.
+    if layout.dynamic:
+        folded_prefix = prefix.casefold()
+        delimiter = re.compile(re.escape(nested_delimiter), re.IGNORECASE)
+        for key, value in os.environ.items():
+            folded_key = key.casefold()
+            if folded_key in env_keys or not folded_key.startswith(folded_prefix):
+                continue
+            segments = delimiter.split(key[len(prefix) :])
+            if len(segments) < 2:
+                continue
+            resolved = layout.resolve(segments, casefold=True)
+            if resolved is not None:
+                infinite_dict.expand(resolved[0], value)
 
     return infinite_dict
@@ -0,0 +1,118 @@
+import threading
+from typing import TYPE_CHECKING, Any, TypeVar
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from confme.core.base_config import BaseConfig
+
+ConfigT = TypeVar("ConfigT", bound="BaseConfig")
+
+# fields per config class which are typed as config class themselves and therefore can be validated lazily
+_SECTION_FIELDS: "WeakKeyDictionary[type, dict[str, type[BaseConfig]]]" = WeakKeyDictionary()
+_SECTION_LOCK = threading.RLock()
+
+
+def section_fields(config_cls: "type[BaseConfig]") -> "dict[str, type[BaseConfig]]":
+    """Returns all fields of the given config class which are typed as config class themselves.
+    :param config_cls: config class
+    :return: dict of field name to config class of the field
+    """
+    from confme.core.base_config import BaseConfig
+
+    sections = _SECTION_FIELDS.get(config_cls)
+    if sections is None:
+        sections = {
+            name: field.annotation
+            for name, field in config_cls.model_fields.items()
+            if isinstance(field.annotation, type) and issubclass(field.annotation, BaseConfig)
+        }
+        _SECTION_FIELDS[config_cls] = sections
+    return sections
+
+
+def _reads_sections(config_cls: "type[BaseConfig]") -> bool:
+    # validators of the class (or of its section fields) might read the sections, so these can't be placeholders
+    decorators = config_cls.__pydantic_decorators__
+    if (
+        decorators.model_validators
+        or decorators.field_validators
+        or decorators.validators
+        or decorators.root_validators
+    ):
+        return True
+    return any(config_cls.model_fields[name].metadata for name in section_fields(config_cls))
+
+
+def _placeholder(config_cls: "type[ConfigT]") -> "ConfigT":
+    # empty instance which is accepted by the validator of the parent without validating its content
+    instance = config_cls.__new__(config_cls)
+    object.__setattr__(instance, "__dict__", {})
+    object.__setattr__(instance, "__pydantic_fields_set__", set())
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def validate_lazy(config_cls: "type[ConfigT]", content: dict[str, Any]) -> "ConfigT":
+    """Validates the given content except for the sections typed as config class. These are kept as raw dicts and
+    validated on first access. Classes with validators are validated eagerly, as the validators might read the
+    sections.
+    :param config_cls: config class to validate
+    :param content: configuration content
+    :return: instance of config_cls with pending sections
+    """
+    if _reads_sections(config_cls):
+        return config_cls.model_validate(content)
+
+    pending: dict[str, Any] = {}
+    placeholders: dict[str, Any] = {}
+    for name, section_cls in section_fields(config_cls).items():
+        key = config_cls.model_fields[name].alias or name
+        if isinstance(content.get(key), dict):
+            pending[name] = content[key]
+            placeholders[key] = _placeholder(section_cls)
+    if not pending:
+        return config_cls.model_validate(content)
+
+    content = {**content, **placeholders}
+    instance = config_cls.model_validate(content)
+    values: dict[str, Any] = object.__getattribute__(instance, "__dict__")
+    for name in pending:
+        del values[name]
+    instance.__pydantic_private__["_lazy_sections"] = pending  # type: ignore[index]
+    return instance
+
+
+def validate_section(instance: "BaseConfig", name: str) -> Any:
+    """Validates a pending section of the given instance and memoizes the result.
+    :param instance: instance with pending sections
+    :param name: name of the section to validate
+    :return: validated section
+    """
+    with _SECTION_LOCK:
+        values: dict[str, Any] = object.__getattribute__(instance, "__dict__")
+        if name in values:
+            return values[name]
+        private = instance.__pydantic_private__
+        pending = private["_lazy_sections"]  # type: ignore[index]
+        section = validate_lazy(section_fields(type(instance))[name], pending[name])
+        values[name] = section
+        del pending[name]
+        if not pending:
+            # fully validated instances are indistinguishable from eagerly validated ones, e.g. for ==
+            private["_lazy_sections"] = None  # type: ignore[index]
+        return section
+
+
+def discard_section(instance: "BaseConfig", name: str) -> None:
+    """Drops the raw content of a pending section of the given instance, e.g. because the section was assigned.
+    :param instance: instance with pending sections
+    :param name: name of the section to drop
+    """
+    with _SECTION_LOCK:
+        private = instance.__pydantic_private__
+        pending = private["_lazy_sections"]  # type: ignore[index]
+        if pending and name in pending:
+            del pending[name]
+            if not pending:
+                private["_lazy_sections"] = None  # type: ignore[index]
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+from pydantic import BaseModel
+
+from confme.utils.path_interpolation import PLACEHOLDER_MARKER, placeholder_values
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+SNAPSHOT_VERSION = 1
+
+# memory addresses and object ids differ between processes and are removed from the schema representation
+_UNSTABLE_REPR = re.compile(r" at 0x[0-9a-f]+|:\d+(?=')")
+_FINGERPRINTS: "WeakKeyDictionary[type[BaseModel], tuple[Any, str]]" = WeakKeyDictionary()
+
+
+class ModelSnapshot:
+    """Picklable snapshot of a validated model. Only fields which were explicitly set are stored, all other fields
+    (e.g. defaults or secrets read from environment variables) are filled in again when the model is rebuilt.
+    """
+
+    __slots__ = ("model_cls", "values")
+
+    def __init__(self, model_cls: type[BaseModel], values: dict[str, Any]):
+        self.model_cls = model_cls
+        self.values = values
+
+    def __getstate__(self):
+        return self.model_cls, self.values
+
+    def __setstate__(self, state):
+        self.model_cls, self.values = state
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return ModelSnapshot(type(value), {name: _freeze(getattr(value, name)) for name in value.model_fields_set})
+    if isinstance(value, list):
+        return [_freeze(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _freeze(v) for k, v in value.items()}
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, ModelSnapshot):
+        values = {name: _thaw(v) for name, v in value.values.items()}
+        return value.model_cls.model_construct(_fields_set=set(values), **values)
+    if isinstance(value, list):
+        return [_thaw(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_thaw(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+def schema_fingerprint(model_cls: type[BaseModel]) -> str:
+    """Returns a fingerprint of the validation schema of the given model, which is stable across processes.
+    :param model_cls: model class
+    :return: hex digest of the schema
+    """
+    core_schema = getattr(model_cls, "__pydantic_core_schema__", None)
+    entry = _FINGERPRINTS.get(model_cls)
+    if entry is not None and entry[0] is core_schema:
+        return entry[1]
+
+    fingerprint = hashlib.sha256(_UNSTABLE_REPR.sub("", repr(core_schema)).encode()).hexdigest()
+    _FINGERPRINTS[model_cls] = (core_schema, fingerprint)
+    return fingerprint
+
+
+def snapshot_key(model_cls: type[BaseModel], file_paths: Path | Sequence[Path], *inputs: Any) -> str:
+    """Builds the key of a snapshot from everything the validated configuration depends on: the content and location
+    of the files, the schema of the model, the working and home directory and the values of the placeholders used in
+    the files (used by path interpolation) and any additional inputs such as the environment and argument overwrites.
+    :param model_cls: model class
+    :param file_paths: path to the configuration file or paths of all layers of a layered configuration
+    :param inputs: additional JSON serializable inputs
+    :return: hex digest identifying the snapshot
+    """
+    resolved = [p.resolve() for p in ([file_paths] if isinstance(file_paths, Path) else file_paths)]
+    digest = hashlib.sha256()
+    placeholders = []
+    for file_path in resolved:
+        content = file_path.read_bytes()
+        digest.update(len(content).to_bytes(8, "little"))
+        digest.update(content)
+        if PLACEHOLDER_MARKER.encode() in content:
+            # registered placeholders might resolve differently, e.g. after register_placeholder
+            placeholders.append(placeholder_values(content.decode(errors="replace"), file_path.parent))
+        else:
+            placeholders.append({})
+    digest.update(
+        json.dumps(
+            [
+                SNAPSHOT_VERSION,
+                [str(p) for p in resolved],
+                os.getcwd(),
+                str(Path.home()),
+                placeholders,
+                schema_fingerprint(model_cls),
+                inputs,
+            ],
+            sort_keys=True,
+            default=str,
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+def _snapshot_path(snapshot_dir: Path, model_cls: type[BaseModel], key: str) -> Path:
+    return snapshot_dir / f"{model_cls.__module__}.{model_cls.__qualname__}-{key}.pickle"
+
+
+def load_snapshot(snapshot_dir: Path, key: str, model_cls: type[ModelT]) -> ModelT | None:
+    """Rebuilds a model from its snapshot without validation. Snapshots are pickle files, so the snapshot directory
+    must only be writable by trusted users.
+    :param snapshot_dir: directory with the snapshots
+    :param key: key of the snapshot (see snapshot_key)
+    :param model_cls: model class
+    :return: rebuilt model or None if there is no usable snapshot
+    """
+    try:
+        with open(_snapshot_path(snapshot_dir, model_cls, key), "rb") as file:
+            snapshot = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logging.warning(f"Ignoring unreadable configuration snapshot of {model_cls.__name__}", exc_info=True)
+        return None
+
+    if not isinstance(snapshot, ModelSnapshot) or snapshot.model_cls is not model_cls:
+        return None
+    return _thaw(snapshot)
+
+
+def save_snapshot(snapshot_dir: Path, key: str, model: BaseModel) -> None:
+    """Writes the snapshot of a validated model atomically. Errors while writing are logged and otherwise ignored.
+    :param snapshot_dir: directory with the snapshots
+    :param key: key of the snapshot (see snapshot_key)
+    :param model: validated model
+    """
+    try:
+        content = pickle.dumps(_freeze(model), protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        logging.warning(f"Configuration {type(model).__name__} can't be snapshotted", exc_info=True)
+        return
+
+    tmp_path = None
+    try:
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=snapshot_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(tmp_path, _snapshot_path(snapshot_dir, type(model), key))
+    except BaseException as e:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        if not isinstance(e, OSError):
+            raise
+        # snapshots are a best effort cache, the validated configuration is returned anyway
+        logging.warning(f"Not able to write configuration snapshot of {type(model).__name__}", exc_info=True)
@@ -1,35 +1,113 @@
+import os
 from os import path
 from pathlib import Path
 from typing import Any
 
-from confme.source_backend.backend_yaml import YamlFileParser
-from confme.utils.path_interpolation import interpolate_paths
+from confme.source_backend.file_cache import MISSING, CacheInfo, FileCache
+from confme.source_backend.parser_registry import get_parser, register_parser, registered_endings
+from confme.utils.deprecated import log_deprecated
+from confme.utils.instrumentation import INTERPOLATE, PARSE_FILE, current_report, stage
+from confme.utils.path_interpolation import PLACEHOLDER_MARKER, interpolate_paths
 
-FILE_PARSER = [YamlFileParser()]
+__all__ = [
+    "cache_info",
+    "clear_cache",
+    "get_parser",
+    "parse_file",
+    "read_json",
+    "register_parser",
+    "registered_endings",
+]
 
+FILE_CACHE = FileCache()
 
-def parse_file(file_path: str | Path, interpolate: bool = True) -> dict[str, Any]:
+
+def __getattr__(name: str) -> Any:
+    if name == "FILE_PARSER":
+        # FILE_PARSER was replaced by the parser registry. Changes of the returned list have no effect anymore, parsers
+        # need to be added with register_parser.
+        log_deprecated("FILE_PARSER is deprecated, use get_parser and register_parser instead.")
+        parsers = [get_parser(f"config{ending}") for ending in registered_endings()]
+        return list({id(parser): parser for parser in parsers}.values())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def parse_file(
+    file_path: str | Path,
+    interpolate: bool = True,
+    use_cache: bool = True,
+    select: list[str] | None = None,
+    copy: bool = True,
+) -> dict[str, Any]:
     """Parses the given file with the right file parser based on the filename ending of the
     given file_path. Supports path interpolation with %(here)s placeholder.
 
     :param file_path: path to the file
     :param interpolate: If True, interpolate path placeholders like %(here)s. Defaults to True.
+    :param use_cache: If True, the parsed content is cached until the file changes. Defaults to True.
+    :param select: If set, only the subtree at the given path segments is parsed and returned.
+    :param copy: If False, the cached content is shared with the caller instead of copied. The returned content must
+    not be modified then. Defaults to True.
     :return: Dict with content of the file
     """
     file_path_obj = Path(file_path)
-    file_path_str = str(file_path_obj)
-    ending = path.splitext(file_path_str)[-1]
-    applicable_file_parsers = [p for p in FILE_PARSER if ending in p.get_endings()]
-    if len(applicable_file_parsers) < 0:
-        raise Exception(f"File Ending {ending} not known")
-    if len(applicable_file_parsers) > 1:
-        raise Exception("More than one parser registered for this file ending... 🧐")
-
-    with open(file_path_str) as file:
-        config = applicable_file_parsers[0].parse(file)
+    config = MISSING
+    cache_key = None
+    with stage(PARSE_FILE):
+        if use_cache:
+            # the content is cached before interpolation, as placeholders like %(cwd)s depend on the process state
+            cache_key = FILE_CACHE.key(file_path_obj, tuple(select) if select else None)
+            config = FILE_CACHE.get(cache_key, copy, default=MISSING)
+        if config is MISSING:
+            config = _parse(file_path_obj, select)
+            if cache_key is not None:
+                FILE_CACHE.put(cache_key, config, copy)
 
     if interpolate:
-        config_dir = file_path_obj.parent
-        config = interpolate_paths(config, config_dir)
-
+        with stage(INTERPOLATE):
+            config = interpolate_paths(config, file_path_obj.parent)
     return config
+
+
+def _parse(file_path: Path, select: list[str] | None) -> dict[str, Any]:
+    parser = get_parser(file_path)
+    with open(file_path, "rb" if parser.binary else "r") as file:
+        report = current_report()
+        if report is not None:
+            report.bytes += os.fstat(file.fileno()).st_size
+        if select:
+            return parser.parse_subtree(file, select)
+        return parser.parse(file)
+
+
+def read_json(file_path: str | Path) -> bytes | None:
+    """Returns the raw content of a json file which doesn't need any path interpolation. Such files can be passed
+    directly to pydantic's model_validate_json without building an intermediate python dict.
+
+    :param file_path: path to the file
+    :return: raw file content or None if the file is not parsed by the built-in json parser or contains placeholders
+    """
+    if path.splitext(str(file_path))[-1].lower() != ".json":
+        return None
+    from confme.source_backend.backend_json import JsonFileParser
+
+    # parsers registered for .json (e.g. json with comments) need the regular parse path
+    if type(get_parser(file_path)) is not JsonFileParser:
+        return None
+    with open(file_path, "rb") as file:
+        content = file.read()
+    if PLACEHOLDER_MARKER.encode() in content:
+        return None
+    return content
+
+
+def clear_cache() -> None:
+    """Removes all parsed files from the cache and resets its statistics."""
+    FILE_CACHE.clear()
+
+
+def cache_info() -> CacheInfo:
+    """Returns the statistics of the parsed file cache.
+    :return: hits, misses, max_size and current_size of the cache
+    """
+    return FILE_CACHE.info()
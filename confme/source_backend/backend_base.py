@@ -1,12 +1,30 @@
 """base module for all file backends e.g. yaml, json, xml, ..."""
 
 from abc import abstractmethod
-from typing import Any, TextIO
+from typing import IO, Any
+
+from confme.utils.base_exception import ConfmeException
+
+
+def select_path(content: Any, path: list[str]) -> Any:
+    """Returns the subtree at the given path of the parsed file content.
+    :param content: parsed file content
+    :param path: segments of the path to select
+    :return: selected subtree
+    """
+    for i, segment in enumerate(path):
+        if not isinstance(content, dict) or segment not in content:
+            raise ConfmeException(f"Path {'.'.join(path[: i + 1])} not found in configuration file")
+        content = content[segment]
+    return content
 
 
 class BaseFileParser:
     """Base class for all file backends"""
 
+    # if True, the file is opened in binary mode and parse receives a binary instead of a text stream
+    binary: bool = False
+
     @abstractmethod
     def get_endings(self) -> list[str]:
         """Returns a list of file endings (including point e.g. .json)
@@ -16,9 +34,18 @@ class BaseFileParser:
         pass
 
     @abstractmethod
-    def parse(self, file: TextIO) -> dict[str, Any]:
+    def parse(self, file: IO[Any]) -> dict[str, Any]:
         """Base method for converting the given string into a python dict
-        :param file: TextIO with access to the raw file data
+        :param file: text stream (binary stream if binary is set) with access to the raw file data
         :return: Dict of file content
         """
         pass
+
+    def parse_subtree(self, file: IO[Any], path: list[str]) -> Any:
+        """Parses only the subtree at the given path. Backends should override this method if they are able to skip
+        the unselected parts of the file.
+        :param file: text stream (binary stream if binary is set) with access to the raw file data
+        :param path: segments of the path to select
+        :return: selected subtree of the file content
+        """
+        return select_path(self.parse(file), path)
@@ -0,0 +1,28 @@
+"""module for parsing json files"""
+
+import json
+import logging
+from typing import IO, Any
+
+from confme.source_backend.backend_base import BaseFileParser
+
+
+class JsonFileParser(BaseFileParser):
+    """File Parser for json files"""
+
+    def get_endings(self) -> list[str]:
+        """Returns all json file endings
+        :return: List of json file endings
+        """
+        return [".json"]
+
+    def parse(self, file: IO[str]) -> dict[str, Any]:
+        """Converts the given json file into a python dict
+        :param file: json file stream
+        :return: Content of json file converted to dict
+        """
+        try:
+            return json.load(file)
+        except json.JSONDecodeError:
+            logging.exception("Not able to parse json file")
+            raise
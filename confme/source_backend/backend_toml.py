@@ -0,0 +1,41 @@
+"""module for parsing toml files"""
+
+import logging
+from typing import IO, Any
+
+from confme.source_backend.backend_base import BaseFileParser
+from confme.utils.base_exception import ConfmeException
+
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    # python < 3.11 only ships tomllib as third party package tomli
+    try:
+        import tomli as tomllib  # type: ignore[no-redef]
+    except ImportError:
+        tomllib = None  # type: ignore[assignment]
+
+
+class TomlFileParser(BaseFileParser):
+    """File Parser for toml files"""
+
+    binary = True
+
+    def get_endings(self) -> list[str]:
+        """Returns all toml file endings
+        :return: List of toml file endings
+        """
+        return [".toml"]
+
+    def parse(self, file: IO[bytes]) -> dict[str, Any]:
+        """Converts the given toml file into a python dict
+        :param file: binary toml file stream
+        :return: Content of toml file converted to dict
+        """
+        if tomllib is None:
+            raise ConfmeException("Parsing toml files requires python >= 3.11 or the tomli package")
+        try:
+            return tomllib.load(file)
+        except tomllib.TOMLDecodeError:
+            logging.exception("Not able to parse toml file")
+            raise
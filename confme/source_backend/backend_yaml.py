@@ -1,12 +1,22 @@
 """module for parsing yaml files"""
 
 import logging
-from typing import Any, TextIO
+from typing import IO, Any
 
 import yaml
+from yaml.nodes import MappingNode, ScalarNode
 from yaml.parser import ParserError
 
-from confme.source_backend.backend_base import BaseFileParser
+from confme.source_backend.backend_base import BaseFileParser, select_path
+from confme.utils.base_exception import ConfmeException
+
+# use the libyaml based loader if PyYAML was built with it and fall back to the pure python loader otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
 
 
 class YamlFileParser(BaseFileParser):
@@ -18,13 +28,41 @@ class YamlFileParser(BaseFileParser):
         """
         return [".yaml", ".yml"]
 
-    def parse(self, file: TextIO) -> dict[str, Any]:
+    def parse(self, file: IO[str]) -> dict[str, Any]:
         """Converts the given yaml file into a python dict
         :param file: yaml file stream
         :return: Content of yaml file converted to dict
         """
         try:
-            return yaml.safe_load(file)
+            return yaml.load(file, Loader=SafeLoader)
+        except ParserError as err:
+            logging.exception("Not able to parse yaml file")
+            raise ParserError from err
+
+    def parse_subtree(self, file: IO[str], path: list[str]) -> Any:
+        """Converts only the subtree at the given path into python objects. The file is composed into yaml nodes
+        first and only the selected node is constructed, i.e. no python objects are built for unselected keys.
+        :param file: yaml file stream
+        :param path: segments of the path to select
+        :return: Content of the selected subtree
+        """
+        loader = SafeLoader(file)
+        try:
+            node = loader.get_single_node()
+            for i, segment in enumerate(path):
+                if not isinstance(node, MappingNode) or any(k.tag == _MERGE_TAG for k, _ in node.value):
+                    # merge keys can only be resolved by constructing the mapping
+                    content = loader.construct_document(node) if node is not None else None
+                    return select_path(content, path[i:])
+                node = next(
+                    (v for k, v in node.value if isinstance(k, ScalarNode) and k.value == segment),
+                    None,
+                )
+                if node is None:
+                    raise ConfmeException(f"Path {'.'.join(path[: i + 1])} not found in configuration file")
+            return loader.construct_document(node)
         except ParserError as err:
             logging.exception("Not able to parse yaml file")
             raise ParserError from err
+        finally:
+            loader.dispose()
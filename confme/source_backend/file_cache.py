@@ -0,0 +1,94 @@
+"""module for caching parsed configuration files"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from confme.utils.dict_util import deep_copy
+
+# marks entries which are not cached, as None is a valid parsed content (e.g. of an empty yaml file)
+MISSING: Any = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int
+    current_size: int
+
+
+class FileCache:
+    """Bounded LRU cache of parsed configuration files. Entries are keyed on the resolved file path plus its
+    modification time and size or, if content_hash is set, on a hash of the file content. By default, cached entries
+    are never handed out directly, instead a copy is returned so that callers can't corrupt the cache by updating the
+    result. Callers which don't modify the content (e.g. the non-mutating merge of layered configurations) can opt out
+    of the copies and share the cached content.
+    """
+
+    def __init__(self, max_size: int = 32, content_hash: bool = False):
+        self.max_size = max_size
+        self.content_hash = content_hash
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, file_path: Path, *options: Any) -> tuple:
+        """Builds the cache key of the given file.
+        :param file_path: path to the file
+        :param options: additional options the parsed content depends on
+        :return: cache key
+        """
+        resolved = file_path.resolve()
+        if self.content_hash:
+            return (str(resolved), hashlib.sha256(resolved.read_bytes()).hexdigest(), *options)
+        stat = os.stat(resolved)
+        return (str(resolved), stat.st_mtime_ns, stat.st_size, *options)
+
+    def get(self, key: tuple, copy: bool = True, default: Any = None) -> Any:
+        """Returns a copy of the cached content or the default if the key is not cached.
+        :param key: cache key
+        :param copy: If False, the cached content itself is returned and must not be modified
+        :param default: returned if the key is not cached, e.g. MISSING to tell apart files without content
+        :return: copy of the cached content
+        """
+        with self._lock:
+            content = self._entries.get(key, MISSING)
+            if content is MISSING:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return deep_copy(content) if copy else content
+
+    def put(self, key: tuple, content: Any, copy: bool = True) -> None:
+        """Adds a copy of the given content to the cache and evicts the least recently used entries.
+        :param key: cache key
+        :param content: parsed file content
+        :param copy: If False, the content itself is cached and must not be modified by the caller afterwards
+        """
+        if self.max_size <= 0:
+            return
+        if copy:
+            content = deep_copy(content)
+        with self._lock:
+            self._entries[key] = content
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Returns the cache statistics.
+        :return: hits, misses, max_size and current_size of the cache
+        """
+        return CacheInfo(self.hits, self.misses, self.max_size, len(self._entries))
@@ -0,0 +1,119 @@
+"""registry of all file backends keyed by file ending"""
+
+import logging
+import threading
+from importlib import import_module
+from os import path
+from pathlib import Path
+from typing import TYPE_CHECKING, Union
+
+from confme.source_backend.backend_base import BaseFileParser
+from confme.utils.base_exception import ConfmeException
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+
+# entry point group used by third party packages to provide additional file backends. The name of an entry point is
+# the file ending it handles (e.g. "ini" or ".ini"), its value the parser class (e.g. "my_package.ini:IniFileParser")
+ENTRY_POINT_GROUP = "confme.parsers"
+
+# registered backends are either parser instances or references to a parser class which is imported on first use
+ParserSpec = Union[BaseFileParser, "EntryPoint", str]
+
+_PARSERS: dict[str, ParserSpec] = {
+    ".yaml": "confme.source_backend.backend_yaml:YamlFileParser",
+    ".yml": "confme.source_backend.backend_yaml:YamlFileParser",
+    ".json": "confme.source_backend.backend_json:JsonFileParser",
+    ".toml": "confme.source_backend.backend_toml:TomlFileParser",
+}
+_LOCK = threading.Lock()
+_entry_points_loaded = False
+
+
+def _normalize_ending(ending: str) -> str:
+    ending = ending.lower()
+    return ending if ending.startswith(".") else f".{ending}"
+
+
+def register_parser(parser: BaseFileParser | str, endings: list[str] | None = None) -> None:
+    """Registers a file backend. A backend registered for an already known file ending replaces the previous one.
+    :param parser: parser instance or reference to a parser class in the form "module:ClassName". References are
+    imported when the first file with one of the given endings is parsed.
+    :param endings: file endings handled by the parser. Defaults to parser.get_endings() and is required for references.
+    """
+    if endings is None:
+        if isinstance(parser, str):
+            raise ConfmeException(f"File endings are required to register parser {parser}")
+        endings = parser.get_endings()
+    with _LOCK:
+        for ending in endings:
+            _PARSERS[_normalize_ending(ending)] = parser
+
+
+def registered_endings() -> list[str]:
+    """Returns all file endings for which a parser is registered, including the ones provided by entry points.
+    :return: sorted list of file endings
+    """
+    _load_entry_points()
+    return sorted(_PARSERS)
+
+
+def get_parser(file_path: str | Path) -> BaseFileParser:
+    """Returns the parser for the given file based on its file ending. Lazily registered backends are imported and
+    instantiated on first use.
+    :param file_path: path to the file
+    :return: parser responsible for the file
+    """
+    ending = path.splitext(str(file_path))[-1].lower()
+    spec = _PARSERS.get(ending)
+    if isinstance(spec, BaseFileParser):
+        return spec
+    if spec is None:
+        _load_entry_points()
+        spec = _PARSERS.get(ending)
+        if spec is None:
+            raise ConfmeException(f"File ending {ending} not known, supported are: {', '.join(registered_endings())}")
+        if isinstance(spec, BaseFileParser):
+            return spec
+
+    parser = _instantiate(spec)
+    with _LOCK:
+        # replace every reference to the same spec, so that e.g. .yaml and .yml share one parser instance
+        for key, value in _PARSERS.items():
+            if type(value) is type(spec) and value == spec:
+                _PARSERS[key] = parser
+    return parser
+
+
+def _instantiate(spec: "EntryPoint | str") -> BaseFileParser:
+    try:
+        if isinstance(spec, str):
+            module_name, cls_name = spec.split(":", 1)
+            parser_cls = getattr(import_module(module_name), cls_name)
+        else:
+            parser_cls = spec.load()
+    except (ImportError, AttributeError, ValueError) as e:
+        raise ConfmeException(f"Not able to load parser {spec}") from e
+    return parser_cls()
+
+
+def _load_entry_points() -> None:
+    """Registers the backends provided by installed packages. Entry points are only discovered once and don't replace
+    parsers that were registered explicitly or are built in.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    # importlib.metadata is comparably expensive to import and only needed once a file ending is not known
+    from importlib.metadata import entry_points
+
+    with _LOCK:
+        if _entry_points_loaded:
+            return
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            ending = _normalize_ending(entry_point.name)
+            if ending in _PARSERS:
+                logging.debug(f"Parser for {ending} already registered, ignoring entry point {entry_point.value}")
+                continue
+            _PARSERS[ending] = entry_point
+        _entry_points_loaded = True
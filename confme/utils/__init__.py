@@ -1,3 +1,3 @@
-from confme.utils.path_interpolation import interpolate_paths
+from confme.utils.path_interpolation import interpolate_paths, register_placeholder
 
-__all__ = ["interpolate_paths"]
+__all__ = ["interpolate_paths", "register_placeholder"]
@@ -1,3 +1,12 @@
 class ConfmeException(Exception):
     def __init__(self, msg: str):
         super().__init__(msg)
+
+
+class PreloadError(ConfmeException):
+    """Raised if one or more environments could not be loaded. The exception of each environment is kept in errors."""
+
+    def __init__(self, errors: dict[str, Exception]):
+        self.errors = errors
+        details = "\n".join(f"  {env}: {type(e).__name__}: {e}" for env, e in errors.items())
+        super().__init__(f"Loading failed for {len(errors)} environment(s):\n{details}")
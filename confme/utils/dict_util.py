@@ -1,7 +1,9 @@
 import collections.abc
 from collections import defaultdict
 from collections.abc import MutableMapping
-from typing import Any
+from typing import Any, Literal
+
+from confme.utils.base_exception import ConfmeException
 
 
 def flatten(d: MutableMapping[Any, Any], parent_key: str = "", sep: str = ".") -> tuple[list[str], list[Any]]:
@@ -19,13 +21,74 @@ def flatten(d: MutableMapping[Any, Any], parent_key: str = "", sep: str = ".") -
     return items, values
 
 
-def recursive_update(d, u):
-    for k, v in u.items():
-        if isinstance(v, collections.abc.Mapping):
-            d[k] = recursive_update(d.get(k, {}), v)
+def deep_copy(obj: Any) -> Any:
+    """Copies nested dicts and lists, e.g. the content of a parsed configuration file. In contrast to copy.deepcopy
+    all other values are considered immutable and are shared between the original and the copy.
+    :param obj: object to copy
+    :return: copy of the given object
+    """
+    if isinstance(obj, dict):
+        return {k: deep_copy(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [deep_copy(v) for v in obj]
+    if isinstance(obj, set):
+        return set(obj)
+    return obj
+
+
+ListPolicy = Literal["replace", "append"]
+LIST_POLICIES: tuple[ListPolicy, ...] = ("replace", "append")
+_MISSING = object()
+
+
+def merge(base: Any, update: Any, list_policy: ListPolicy = "replace") -> Any:
+    """Merges update into base without modifying either of them. Nested dicts are merged recursively, dicts keyed only
+    by list indices (e.g. from workers.0.host overwrites) update single list elements and all other values of update
+    replace the ones of base. Subtrees which are not changed are shared between the inputs and the result, i.e. the
+    result must not be modified in place if the inputs are still in use.
+    :param base: base value, e.g. the content of a parsed configuration file
+    :param update: value to merge into base
+    :param list_policy: replace: lists of update replace the lists of base, append: lists of update are appended to
+    the lists of base
+    :return: merged value
+    """
+    if isinstance(update, collections.abc.Mapping):
+        if isinstance(base, collections.abc.Mapping):
+            result = None
+            for k, v in update.items():
+                current = base.get(k, _MISSING)
+                value = v if current is _MISSING else merge(current, v, list_policy)
+                if value is current:
+                    continue
+                if result is None:
+                    result = dict(base)
+                result[k] = value
+            return base if result is None else result
+        if isinstance(base, list) and _is_index_patch(update):
+            return _merge_list_elements(base, update, list_policy)
+        return update
+    if list_policy == "append" and isinstance(base, list) and isinstance(update, list):
+        return base + update if update else base
+    return update
+
+
+def _is_index_patch(update: collections.abc.Mapping) -> bool:
+    # env and argv overwrites of list elements are keyed by their index (e.g. workers.0.host), any other mapping of a
+    # later layer replaces the list
+    return bool(update) and all(isinstance(k, str) and k.isdecimal() for k in update)
+
+
+def _merge_list_elements(base: list, update: collections.abc.Mapping, list_policy: ListPolicy) -> list:
+    result = list(base)
+    for k, v in update.items():
+        i = int(k)
+        if i > len(result):
+            raise ConfmeException(f"Index {i} out of range for list of length {len(result)}")
+        if i < len(result):
+            result[i] = merge(result[i], v, list_policy)
         else:
-            d[k] = v
-    return d
+            result.append(v)
+    return result
 
 
 class InfiniteDict(defaultdict):
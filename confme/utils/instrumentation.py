@@ -0,0 +1,247 @@
+"""Per stage timing of the load pipeline. Observers registered with add_observer receive a LoadReport for every
+configuration that is loaded by BaseConfig.load, load_from_dict or a BaseConfig.get cache miss. If no observer is
+registered, the instrumentation is reduced to a check of the observer list.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, NamedTuple
+
+PARSE_FILE = "parse_file"
+INTERPOLATE = "interpolate"
+ENV_OVERWRITE = "env_overwrite"
+ARGUMENT_OVERWRITE = "argument_overwrite"
+MERGE = "merge"
+VALIDATE = "validate"
+SNAPSHOT = "snapshot"
+TOTAL = "total"
+
+
+class LoadReport:
+    """Measurements of a single load. Stages which run several times (e.g. merge of environment variables and
+    arguments) are summed up.
+    """
+
+    __slots__ = ("config_cls", "path", "env", "stages", "bytes", "leaves", "duration", "error")
+
+    def __init__(self, config_cls: type, path: str | None = None, env: str | None = None):
+        self.config_cls = config_cls
+        self.path = path
+        self.env = env
+        # duration in seconds per stage
+        self.stages: dict[str, float] = {}
+        # number of bytes read from configuration files
+        self.bytes = 0
+        # number of leaf values passed to the validation
+        self.leaves = 0
+        self.duration = 0.0
+        self.error: BaseException | None = None
+
+    def add(self, stage: str, duration: float) -> None:
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+
+    def __repr__(self) -> str:
+        stages = ", ".join(f"{name}={duration * 1000:.3f}ms" for name, duration in self.stages.items())
+        return (
+            f"LoadReport({self.config_cls.__name__}, path={self.path}, env={self.env}, bytes={self.bytes}, "
+            f"leaves={self.leaves}, {stages}, total={self.duration * 1000:.3f}ms)"
+        )
+
+
+LoadObserver = Callable[[LoadReport], None]
+
+_OBSERVERS: list[LoadObserver] = []
+_current_report: ContextVar[LoadReport | None] = ContextVar("confme_load_report", default=None)
+
+
+def add_observer(observer: LoadObserver) -> None:
+    """Registers a callable which receives a LoadReport after every load.
+    :param observer: callable receiving the report, exceptions raised by observers are logged and otherwise ignored
+    """
+    _OBSERVERS.append(observer)
+
+
+def remove_observer(observer: LoadObserver) -> None:
+    """Removes a previously registered observer.
+    :param observer: observer to remove
+    """
+    if observer in _OBSERVERS:
+        _OBSERVERS.remove(observer)
+
+
+def current_report() -> LoadReport | None:
+    """Returns the report of the load running in the current context or None if no observer is registered."""
+    if not _OBSERVERS:
+        return None
+    return _current_report.get()
+
+
+class _NoOp:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NOOP = _NoOp()
+
+
+class _Stage:
+    __slots__ = ("report", "name", "start")
+
+    def __init__(self, report: LoadReport, name: str):
+        self.report = report
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.report.add(self.name, time.perf_counter() - self.start)
+
+
+class _Load:
+    __slots__ = ("report", "start", "token")
+
+    def __init__(self, report: LoadReport):
+        self.report = report
+        self.start = 0.0
+        self.token: Any = None
+
+    def __enter__(self) -> LoadReport:
+        self.token = _current_report.set(self.report)
+        self.start = time.perf_counter()
+        return self.report
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, traceback: Any) -> None:
+        self.report.duration = time.perf_counter() - self.start
+        self.report.error = exc
+        _current_report.reset(self.token)
+        for observer in tuple(_OBSERVERS):
+            try:
+                observer(self.report)
+            except Exception:
+                logging.exception(f"Load observer {observer} failed")
+
+
+def stage(name: str) -> _Stage | _NoOp:
+    """Context manager measuring the duration of a stage of the load running in the current context.
+    :param name: name of the stage
+    """
+    if not _OBSERVERS:
+        return _NOOP
+    report = _current_report.get()
+    if report is None:
+        return _NOOP
+    return _Stage(report, name)
+
+
+def observe_load(config_cls: type, path: Any = None, env: str | None = None) -> _Load | _NoOp:
+    """Context manager reporting a load of the given config class to all observers. Nested loads (e.g. BaseConfig.load
+    called by BaseConfig.get) are part of the outer report.
+    :param config_cls: config class which is loaded
+    :param path: path of the configuration file if known
+    :param env: environment which is loaded if known
+    """
+    if not _OBSERVERS:
+        return _NOOP
+    report = _current_report.get()
+    if report is not None:
+        if report.path is None and path is not None:
+            report.path = str(path)
+        return _NOOP
+    return _Load(LoadReport(config_cls, None if path is None else str(path), env))
+
+
+def count_leaves(content: Any) -> int:
+    """Counts the leaf values of the given nested dict and list structure."""
+    if isinstance(content, dict):
+        return sum(count_leaves(v) for v in content.values())
+    if isinstance(content, list):
+        return sum(count_leaves(v) for v in content)
+    return 1
+
+
+class StageSummary(NamedTuple):
+    calls: int
+    total: float
+    mean: float
+    p50: float
+    p99: float
+
+
+class LoadStatistics:
+    """Observer aggregating the reports per stage. The most recent max_samples durations of each stage are kept to
+    compute the percentiles.
+
+    Usage:
+    ```
+    statistics = LoadStatistics()
+    add_observer(statistics)
+    ...
+    print(statistics.summary())
+    ```
+    """
+
+    def __init__(self, max_samples: int = 10_000):
+        self.max_samples = max_samples
+        self.loads = 0
+        self.errors = 0
+        self.bytes = 0
+        self.leaves = 0
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._totals: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, report: LoadReport) -> None:
+        with self._lock:
+            self.loads += 1
+            self.errors += report.error is not None
+            self.bytes += report.bytes
+            self.leaves += report.leaves
+            for name, duration in (*report.stages.items(), (TOTAL, report.duration)):
+                samples = self._samples.get(name)
+                if samples is None:
+                    samples = self._samples[name] = deque(maxlen=self.max_samples)
+                samples.append(duration)
+                self._counts[name] = self._counts.get(name, 0) + 1
+                self._totals[name] = self._totals.get(name, 0.0) + duration
+
+    def summary(self) -> dict[str, StageSummary]:
+        """Returns the number of calls, total and mean duration as well as the p50 and p99 duration in seconds per stage.
+        :return: dict of stage name to its summary, the duration of the whole load is reported as stage total
+        """
+        with self._lock:
+            result = {}
+            for name, samples in self._samples.items():
+                ordered = sorted(samples)
+                count = self._counts[name]
+                result[name] = StageSummary(
+                    calls=count,
+                    total=self._totals[name],
+                    mean=self._totals[name] / count,
+                    p50=_percentile(ordered, 0.5),
+                    p99=_percentile(ordered, 0.99),
+                )
+            return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self.loads = self.errors = self.bytes = self.leaves = 0
+            self._samples.clear()
+            self._counts.clear()
+            self._totals.clear()
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    # nearest rank percentile of the sorted samples
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
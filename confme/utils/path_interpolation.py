@@ -1,38 +1,116 @@
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+PlaceholderResolver = Callable[[Path], str]
+
+_PLACEHOLDER_PATTERN = re.compile(r"%\((\w+)\)s")
+PLACEHOLDER_MARKER = "%("
+
+_PLACEHOLDERS: dict[str, PlaceholderResolver] = {
+    "here": lambda config_dir: str(config_dir.resolve()),
+    "home": lambda config_dir: str(Path.home()),
+    "cwd": lambda config_dir: str(Path.cwd()),
+}
+
+
+def register_placeholder(name: str, resolver: PlaceholderResolver) -> None:
+    """Register an additional %(name)s placeholder.
+
+    :param name: Name of the placeholder
+    :param resolver: Callable receiving the directory containing the configuration file and returning the replacement
+    """
+    _PLACEHOLDERS[name] = resolver
+
+
+def placeholder_values(content: str, config_dir: Path) -> dict[str, str | None]:
+    """Resolves the placeholders used in the given raw file content, e.g. to detect whether the interpolated content
+    of a file changed although the file itself didn't.
+
+    :param content: Raw content of the configuration file
+    :param config_dir: Directory containing the configuration file
+    :return: Dict of placeholder name to its replacement or None if the placeholder is not registered
+    """
+    values = _PlaceholderValues(config_dir)
+    return {name: values[name] for name in sorted(set(_PLACEHOLDER_PATTERN.findall(content)))}
+
+
+class _PlaceholderValues(dict):
+    """Replacement values of one configuration file. Every placeholder is resolved at most once and only if it is
+    used, e.g. the config directory is resolved once per file instead of once per string.
+    """
+
+    def __init__(self, config_dir: Path):
+        super().__init__()
+        self.config_dir = config_dir
+
+    def __missing__(self, name: str) -> str | None:
+        resolver = _PLACEHOLDERS.get(name)
+        value = resolver(self.config_dir) if resolver is not None else None
+        self[name] = value
+        return value
 
 
 def interpolate_paths(config: dict[str, Any], config_dir: Path) -> dict[str, Any]:
-    """Recursively interpolate path placeholders in the configuration dictionary.
+    """Recursively interpolate path placeholders in the configuration dictionary. The given dictionary is not
+    modified, unchanged sub-dictionaries and lists are shared between the given and the returned dictionary.
 
     Supports the following placeholders:
     - %(here)s: Replaced with the absolute path to the directory containing the config file
+    - %(home)s: Replaced with the home directory of the current user
+    - %(cwd)s: Replaced with the current working directory
+    Additional placeholders can be added with register_placeholder.
 
     :param config: Configuration dictionary to process
     :param config_dir: Absolute path to the directory containing the configuration file
     :return: Configuration dictionary with interpolated paths
     """
-    return _recursive_interpolate(config, config_dir)
+    return _recursive_interpolate(config, _PlaceholderValues(config_dir))
 
 
-def _recursive_interpolate(obj: Any, config_dir: Path) -> Any:
+def _recursive_interpolate(obj: Any, values: _PlaceholderValues) -> Any:
     """Recursively process configuration values and interpolate path placeholders.
 
     :param obj: Any configuration value (dict, list, str, or other)
-    :param config_dir: Absolute path to the directory containing the configuration file
-    :return: Processed value with interpolated paths
+    :param values: Replacement values of the placeholders
+    :return: Processed value with interpolated paths, or obj itself if nothing was interpolated
     """
-    if isinstance(obj, dict):
-        return {key: _recursive_interpolate(value, config_dir) for key, value in obj.items()}
+    if isinstance(obj, str):
+        if PLACEHOLDER_MARKER not in obj:
+            return obj
+        result = _substitute(obj, values)
+        return obj if result == obj else result
+    elif isinstance(obj, dict):
+        result = obj
+        for key, value in obj.items():
+            new_value = _recursive_interpolate(value, values)
+            if new_value is not value:
+                if result is obj:
+                    result = dict(obj)
+                result[key] = new_value
+        return result
     elif isinstance(obj, list):
-        return [_recursive_interpolate(item, config_dir) for item in obj]
-    elif isinstance(obj, str):
-        return _interpolate_string(obj, config_dir)
+        result = obj
+        for i, value in enumerate(obj):
+            new_value = _recursive_interpolate(value, values)
+            if new_value is not value:
+                if result is obj:
+                    result = list(obj)
+                result[i] = new_value
+        return result
     else:
         return obj
 
 
+def _substitute(value: str, values: _PlaceholderValues) -> str:
+    def replace_match(match: re.Match[str]) -> str:
+        replacement = values[match.group(1)]
+        # If placeholder is not recognized, leave it unchanged
+        return match.group(0) if replacement is None else replacement
+
+    return _PLACEHOLDER_PATTERN.sub(replace_match, value)
+
+
 def _interpolate_string(value: str, config_dir: Path) -> str:
     """Interpolate path placeholders in a string value.
 
@@ -40,19 +118,6 @@ def _interpolate_string(value: str, config_dir: Path) -> str:
     :param config_dir: Absolute path to the directory containing the configuration file
     :return: String with placeholders replaced
     """
-    # Define available placeholders
-    placeholders = {
-        "here": str(config_dir.resolve()),
-    }
-
-    # Replace %(name)s style placeholders
-    pattern = re.compile(r"%\((\w+)\)s")
-
-    def replace_match(match: re.Match[str]) -> str:
-        placeholder_name = match.group(1)
-        if placeholder_name in placeholders:
-            return placeholders[placeholder_name]
-        # If placeholder is not recognized, leave it unchanged
-        return match.group(0)
-
-    return pattern.sub(replace_match, value)
+    if PLACEHOLDER_MARKER not in value:
+        return value
+    return _substitute(value, _PlaceholderValues(config_dir))
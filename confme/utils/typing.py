@@ -1,21 +1,279 @@
+import collections.abc
+import json
+import types
+from typing import Annotated, Any, Union, get_args, get_origin
+from weakref import WeakKeyDictionary
+
 from pydantic import BaseModel
 
 
-def _create_dict(schema_head: dict, definitions: dict):
-    schema_dict = {}
-    if "type" in schema_head and schema_head["type"] == "object":
-        for key, value in schema_head["properties"].items():
-            if "$ref" in value:
-                sub_schema = value["$ref"].replace("#/$defs/", "")
-                schema_dict[key] = _create_dict(definitions[sub_schema], definitions)
-            else:
-                schema_dict[key] = None
-    else:
+class ParameterNode:
+    """Node of the compiled parameter trie. Named sub-fields of nested models are stored in children, while the
+    elements of generic containers (list, tuple, set, dict) are represented by a single items node which matches
+    any index (sequences) or key (mappings).
+    """
+
+    __slots__ = ("annotation", "name", "children", "items", "indexed", "_folded", "_attributes", "_json")
+
+    def __init__(self, annotation: Any = None):
+        self.annotation = annotation
+        # attribute name of the model field, children are keyed by the name used at validation time (i.e. its alias)
+        self.name: str | None = None
+        self.children: dict[str, ParameterNode] = {}
+        self.items: ParameterNode | None = None
+        self.indexed = False
+        self._folded: dict[str, str] | None = None
+        self._attributes: dict[str, str] | None = None
+        self._json: bool | None = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children and self.items is None
+
+    def child(self, segment: str, casefold: bool = False) -> "tuple[str, ParameterNode] | None":
+        """Returns the node matching the given path segment.
+        :param segment: single segment of a dot (.) separated path
+        :param casefold: If True, the segment is matched case insensitive against the field names
+        :return: tuple of the field name and its node or None if the segment is not known
+        """
+        node = self.children.get(segment)
+        if node is not None:
+            return segment, node
+        if casefold:
+            if self._folded is None:
+                self._folded = {name.casefold(): name for name in self.children}
+            name = self._folded.get(segment.casefold())
+            if name is not None:
+                return name, self.children[name]
+        if self.items is not None and (not self.indexed or segment.isdigit()):
+            return segment, self.items
         return None
-    return schema_dict
+
+    def field(self, segment: str) -> "ParameterNode | None":
+        """Returns the child node of the model field matching the given segment by its alias or attribute name."""
+        node = self.children.get(segment)
+        if node is not None:
+            return node
+        if self._attributes is None:
+            self._attributes = {child.name: key for key, child in self.children.items() if child.name is not None}
+        key = self._attributes.get(segment)
+        return None if key is None else self.children[key]
+
+    def coerce(self, value: str) -> Any:
+        """Coerces a raw string value (e.g. from the command line) based on the annotation of the node. Values of
+        numeric, boolean, container and model fields are decoded as JSON if possible, all other values are kept as
+        string and converted during validation.
+        :param value: raw string value
+        :return: decoded value
+        """
+        if self._json is None:
+            self._json = _is_json_annotation(self.annotation)
+        if not self._json:
+            return value
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+
+
+_JSON_TYPES = (bool, int, float, type(None))
+
+
+def _is_json_annotation(annotation: Any) -> bool:
+    annotation = _unwrap(annotation)
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        return all(_is_json_annotation(a) for a in get_args(annotation))
+    if annotation in _JSON_TYPES or _is_model(annotation):
+        return True
+    if isinstance(annotation, type) and issubclass(annotation, (list, tuple, set, frozenset, dict)):
+        return True
+    return isinstance(origin, type) and issubclass(
+        origin, (collections.abc.Mapping, collections.abc.Sequence, collections.abc.Set)
+    )
+
+
+def _unwrap(annotation: Any) -> Any:
+    while get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _compile_model(model_cls: type[BaseModel], compiled: dict[type, dict[str, ParameterNode]]):
+    # the children dict is registered before it is filled, so that recursive models reference the same dict
+    if model_cls in compiled:
+        return compiled[model_cls]
+
+    children: dict[str, ParameterNode] = {}
+    compiled[model_cls] = children
+    for name, field in model_cls.model_fields.items():
+        # input data is keyed by the alias of a field, as during validation
+        alias = field.validation_alias if isinstance(field.validation_alias, str) else field.alias
+        node = _compile_annotation(field.annotation, compiled)
+        node.name = name
+        children[alias or name] = node
+    return children
+
+
+def _compile_annotation(annotation: Any, compiled: dict[type, dict[str, ParameterNode]]) -> ParameterNode:
+    node = ParameterNode(annotation)
+    models: list[type[BaseModel]] = []
+    item_annotations: list[Any] = []
+    mapping_annotations: list[Any] = []
+
+    pending = [annotation]
+    while pending:
+        current = _unwrap(pending.pop(0))
+        origin = get_origin(current)
+        if origin is Union or origin is types.UnionType:
+            pending.extend(get_args(current))
+        elif _is_model(current):
+            models.append(current)
+        elif isinstance(origin, type) and issubclass(origin, collections.abc.Mapping):
+            args = get_args(current)
+            if len(args) == 2:
+                mapping_annotations.append(args[1])
+        elif (
+            isinstance(origin, type)
+            and issubclass(origin, (collections.abc.Sequence, collections.abc.Set))
+            and not issubclass(origin, (str, bytes))
+        ):
+            item_annotations.extend(a for a in get_args(current) if a is not Ellipsis)
+
+    if len(models) == 1:
+        node.children = _compile_model(models[0], compiled)
+    else:
+        for model_cls in models:
+            for name, child in _compile_model(model_cls, compiled).items():
+                node.children.setdefault(name, child)
+
+    if item_annotations:
+        node.items = _compile_annotation(Union[tuple(item_annotations)], compiled)  # noqa: UP007
+        node.indexed = True
+    elif mapping_annotations:
+        node.items = _compile_annotation(Union[tuple(mapping_annotations)], compiled)  # noqa: UP007
+
+    return node
+
+
+def compile_parameters(config_cls: type[BaseModel]) -> ParameterNode:
+    """Compiles the parameter trie of the given config class directly from its model fields.
+    :param config_cls: config class to compile
+    :return: root node of the parameter trie
+    """
+    root = ParameterNode(config_cls)
+    root.children = _compile_model(config_cls, {})
+    return root
+
+
+def _flatten_parameters(node: ParameterNode, parent_key: str, visited: list[dict], parameters: list[str]) -> bool:
+    """Collects the static leaf paths below the given node.
+    :return: True if the node contains paths which are not part of the collected parameters, i.e. container elements
+    or recursive models.
+    """
+    # sub-models that already appear on the current path are recursive and only reachable by explicit paths
+    if any(node.children is v for v in visited):
+        return True
+    dynamic = node.items is not None
+    visited.append(node.children)
+    for name, child in node.children.items():
+        key = f"{parent_key}.{name}" if parent_key else name
+        if child.children:
+            dynamic = _flatten_parameters(child, key, visited, parameters) or dynamic
+        else:
+            parameters.append(key)
+            dynamic = dynamic or child.items is not None
+    visited.pop()
+    return dynamic
+
+
+class ParameterLayout:
+    """Compiled parameter structure of a config class. It holds the parameter trie together with the flattened
+    dot (.) separated parameter paths and is shared by the environment, argument and update_by_str code paths.
+    """
+
+    __slots__ = ("root", "parameters", "dynamic", "_segments", "_folded_keys")
+
+    def __init__(self, root: ParameterNode):
+        self.root = root
+        self.parameters: list[str] = []
+        # dynamic layouts contain containers or recursive models, i.e. paths that are not part of the parameter list
+        self.dynamic = _flatten_parameters(root, "", [], self.parameters)
+        self._segments: dict[str, list[str]] = {p: p.split(".") for p in self.parameters}
+        self._folded_keys: dict[tuple[str, str], dict[str, list[str]]] = {}
+
+    def split(self, path: str) -> list[str]:
+        """Splits the given dot (.) separated path into its segments. Known parameter paths are split only once.
+        :param path: dot (.) separated parameter path
+        :return: list of path segments
+        """
+        segments = self._segments.get(path)
+        if segments is None:
+            return path.split(".")
+        return segments
+
+    def folded_keys(self, prefix: str = "", sep: str = ".") -> dict[str, list[str]]:
+        """Returns the casefolded keys of all parameters, e.g. used to look up parameters in environment variables.
+        The keys are built once per prefix and separator.
+        :param prefix: prefix of each key
+        :param sep: separator between the nesting levels of a parameter
+        :return: dict of casefolded key to parameter path segments
+        """
+        keys = self._folded_keys.get((prefix, sep))
+        if keys is None:
+            keys = {(prefix + sep.join(s)).casefold(): s for s in self._segments.values()}
+            self._folded_keys[(prefix, sep)] = keys
+        return keys
+
+    def resolve(self, segments: list[str], casefold: bool = False) -> tuple[list[str], ParameterNode] | None:
+        """Resolves the given path segments in the parameter trie. In contrast to the flat parameter list, indexed
+        paths into containers (e.g. workers.0.host) and paths into recursive models are resolved as well.
+        :param segments: path segments
+        :param casefold: If True, the segments are matched case insensitive against the field names
+        :return: tuple of the segments as named in the config class and the node of the path or None if the path is
+        not known
+        """
+        node = self.root
+        resolved: list[str] = []
+        for segment in segments:
+            match = node.child(segment, casefold)
+            if match is None:
+                return None
+            name, node = match
+            resolved.append(name)
+        return resolved, node
+
+
+# compiled layouts per config class. The pydantic core schema is stored alongside, so that a layout is recompiled
+# whenever the class is rebuilt. Redefined classes are new objects and therefore get their own entry.
+_LAYOUT_CACHE: "WeakKeyDictionary[type[BaseModel], tuple[Any, ParameterLayout]]" = WeakKeyDictionary()
+
+
+def get_layout(config_cls: type[BaseModel]) -> ParameterLayout:
+    """Returns the compiled parameter layout of the given config class. The layout is built once per class and
+    recompiled only if the class is rebuilt.
+    :param config_cls: config class to get the layout for
+    :return: compiled parameter layout
+    """
+    core_schema = getattr(config_cls, "__pydantic_core_schema__", None)
+    entry = _LAYOUT_CACHE.get(config_cls)
+    if entry is not None and entry[0] is core_schema:
+        return entry[1]
+
+    if not config_cls.__pydantic_complete__:
+        # resolve forward references before the fields are compiled
+        config_cls.model_rebuild(raise_errors=False)
+        core_schema = getattr(config_cls, "__pydantic_core_schema__", None)
+
+    layout = ParameterLayout(compile_parameters(config_cls))
+    _LAYOUT_CACHE[config_cls] = (core_schema, layout)
+    return layout
 
 
-def get_schema(config_cls: type[BaseModel]):
-    schema = config_cls.model_json_schema()
-    definitions = schema["$defs"] if "$defs" in schema else {}
-    return _create_dict(schema, definitions)
+def clear_layout_cache() -> None:
+    """Drops all compiled parameter layouts."""
+    _LAYOUT_CACHE.clear()
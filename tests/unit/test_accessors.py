@@ -0,0 +1,109 @@
+import pytest
+from pydantic import field_validator
+
+from confme import BaseConfig, ConfmeException
+from confme.annotation import ClosedRange
+from confme.core import accessors
+
+
+class WorkerConfig(BaseConfig):
+    host: str
+    port: int = ClosedRange(1, 65535)
+
+
+class DatabaseConfig(BaseConfig):
+    host: str
+
+    @field_validator("host")
+    @classmethod
+    def lower_host(cls, value: str) -> str:
+        if " " in value:
+            raise ValueError("host must not contain spaces")
+        return value.lower()
+
+
+class FeatureConfig(BaseConfig):
+    name: str
+    enabled: bool = False
+    workers: list[WorkerConfig] = []
+    limits: dict[str, int] = {}
+    database: DatabaseConfig = DatabaseConfig(host="localhost")
+
+
+@pytest.fixture
+def config() -> FeatureConfig:
+    return FeatureConfig.load_from_dict(
+        {
+            "name": "features",
+            "workers": [{"host": "a", "port": 1}, {"host": "b", "port": 2}],
+            "limits": {"requests": 10},
+        },
+        argv=[],
+    )
+
+
+def test_get_by_str(config: FeatureConfig):
+    assert config.get_by_str("name") == "features"
+    assert config.get_by_str("workers.1.host") == "b"
+    assert config.get_by_str("limits.requests") == 10
+    assert config.get_by_str("workers.0") is config.workers[0]
+
+    with pytest.raises(ConfmeException):
+        config.get_by_str("unknown")
+    with pytest.raises(ConfmeException):
+        config.get_by_str("workers.5.host")
+
+
+def test_update_by_str_validates(config: FeatureConfig):
+    config.update_by_str("enabled", "true")
+    config.update_by_str("workers.1.port", "8080")
+    config.update_by_str("limits.requests", "20")
+
+    assert config.enabled is True
+    assert config.workers[1].port == 8080
+    assert config.limits == {"requests": 20}
+
+    with pytest.raises(ConfmeException, match="workers.0.port"):
+        config.update_by_str("workers.0.port", 70000)
+    with pytest.raises(ConfmeException):
+        config.update_by_str("enabled", "not a bool")
+    assert config.workers[0].port == 1
+
+
+def test_update_by_str_without_validation(config: FeatureConfig):
+    config.update_by_str("workers.0.port", "not validated", validate=False)
+
+    assert config.workers[0].port == "not validated"
+
+
+def test_update_by_str_sub_model(config: FeatureConfig):
+    config.update_by_str("workers.0", {"host": "c", "port": "3"})
+
+    assert config.workers[0] == WorkerConfig(host="c", port=3)
+
+
+def test_update_many_is_atomic(config: FeatureConfig):
+    config.update_many({"name": "updated", "workers.0.host": "z"})
+    assert (config.name, config.workers[0].host) == ("updated", "z")
+
+    with pytest.raises(ConfmeException):
+        config.update_many({"name": "not applied", "workers.0.port": "not a number"})
+    assert config.name == "updated"
+
+
+def test_accessors_are_cached(config: FeatureConfig):
+    accessor = accessors.compile_accessor(FeatureConfig, "workers.0.port")
+
+    assert accessors.compile_accessor(FeatureConfig, "workers.0.port") is accessor
+    assert accessor.steps == ((True, "workers"), (False, 0), (True, "port"))
+
+
+def test_update_by_str_runs_field_validators(config: FeatureConfig):
+    config.update_by_str("database.host", "DB-HOST")
+    assert config.database.host == "db-host"
+
+    with pytest.raises(ConfmeException, match="database.host"):
+        config.update_by_str("database.host", "BAD HOST")
+    with pytest.raises(ConfmeException):
+        config.update_many({"name": "not applied", "database.host": "BAD HOST"})
+    assert (config.name, config.database.host) == ("features", "db-host")
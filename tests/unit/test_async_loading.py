@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from confme import ConfmeException
+from confme.core.async_loading import gather_configs
+from tests.unit.config_model import RootConfig
+
+CONFIG_CONTENT = (
+    "rootValue: 1\n"
+    "rangeValue: 5\n"
+    "childNode:\n"
+    '  testStr: "prod-env"\n'
+    "  testInt: 42\n"
+    "  testFloat: 42.42\n"
+    "  anyEnum: value2"
+)
+
+
+@pytest.fixture
+def config_folder(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.setattr("sys.argv", ["program"])
+    (tmp_path / "prod.yaml").write_text(CONFIG_CONTENT)
+    RootConfig.register_folder(tmp_path, default_env="prod")
+    RootConfig.pin_env("prod")
+    return tmp_path
+
+
+def test_aload_runs_in_executor(config_folder: Path, monkeypatch):
+    load = RootConfig.load
+    threads = []
+
+    def recording_load(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return load(*args, **kwargs)
+
+    monkeypatch.setattr(RootConfig, "load", recording_load)
+
+    config = asyncio.run(RootConfig.aload(config_folder / "prod.yaml", argv=["++rootValue=2"]))
+
+    assert config.rootValue == 2
+    assert threads and threads[0] != threading.get_ident()
+
+
+def test_aget_coalesces_loads(config_folder: Path, monkeypatch):
+    load_file = RootConfig._load_file
+    loads = []
+
+    def slow_load_file(environment: str):
+        loads.append(environment)
+        time.sleep(0.05)
+        return load_file(environment)
+
+    monkeypatch.setattr(RootConfig, "_load_file", slow_load_file)
+
+    async def get_all():
+        return await asyncio.gather(*(RootConfig.aget() for _ in range(16)))
+
+    configs = asyncio.run(get_all())
+
+    assert loads == ["prod"]
+    assert all(c is configs[0] for c in configs)
+    # the loaded configuration is cached for get() as well
+    assert RootConfig.get() is configs[0]
+    assert asyncio.run(RootConfig.aget()) is configs[0]
+
+
+def test_aget_error(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["program"])
+    RootConfig.register_folder(tmp_path, default_env="prod")
+    RootConfig.pin_env("prod")
+
+    with pytest.raises(ConfmeException):
+        asyncio.run(RootConfig.aget())
+
+
+def test_gather_configs(config_folder: Path):
+    missing = config_folder / "missing.yaml"
+
+    async def gather():
+        return await gather_configs(
+            RootConfig, (RootConfig, config_folder / "prod.yaml"), (RootConfig, missing), return_exceptions=True
+        )
+
+    from_get, from_file, error = asyncio.run(gather())
+
+    assert from_get is RootConfig.get()
+    assert from_file.childNode.testStr == "prod-env"
+    assert isinstance(error, FileNotFoundError)
@@ -0,0 +1,79 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from confme import ConfmeException
+from tests.unit.config_model import RootConfig
+
+
+@pytest.fixture
+def config_folder(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.delenv("ENV", raising=False)
+    (tmp_path / "prod.yaml").write_text(
+        "rootValue: 1\n"
+        "rangeValue: 5\n"
+        "childNode:\n"
+        '  testStr: "prod-env"\n'
+        "  testInt: 42\n"
+        "  testFloat: 42.42\n"
+        "  anyEnum: value2"
+    )
+    return tmp_path
+
+
+def test_single_flight_get(config_folder: Path, monkeypatch):
+    RootConfig.register_folder(config_folder, default_env="prod")
+    load_file = RootConfig._load_file
+    loads = []
+    loads_lock = threading.Lock()
+
+    def slow_load_file(environment: str):
+        with loads_lock:
+            loads.append(environment)
+        time.sleep(0.05)
+        return load_file(environment)
+
+    monkeypatch.setattr(RootConfig, "_load_file", slow_load_file)
+
+    start = threading.Barrier(32)
+
+    def get_config():
+        start.wait()
+        return RootConfig.get()
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        futures = [executor.submit(get_config) for _ in range(32)]
+        configs = [f.result() for f in futures]
+
+    assert loads == ["prod"]
+    assert all(c is configs[0] for c in configs)
+    assert RootConfig.get() is configs[0]
+
+
+def test_failed_load_is_retried(config_folder: Path):
+    content = (config_folder / "prod.yaml").read_text()
+    (config_folder / "prod.yaml").unlink()
+    RootConfig.register_folder(config_folder, default_env="prod")
+
+    with pytest.raises(ConfmeException):
+        RootConfig.get()
+
+    (config_folder / "prod.yaml").write_text(content)
+    assert RootConfig.get().childNode.testStr == "prod-env"
+
+
+def test_load_locks_released(config_folder: Path):
+    content = (config_folder / "prod.yaml").read_text()
+    for env in ("tenant_a", "tenant_b", "tenant_c"):
+        (config_folder / f"{env}.yaml").write_text(content)
+    RootConfig.register_folder(config_folder, default_env="prod")
+
+    for env in ("prod", "tenant_a", "tenant_b", "tenant_c"):
+        RootConfig._load_single_flight(env)
+
+    assert len(RootConfig.__cache__) == 4
+    assert not RootConfig.__cache__._load_locks
@@ -0,0 +1,75 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from confme import BaseConfig
+from confme.core.config_cache import ConfigCache
+from tests.unit.config_model import FlatConfig
+
+
+class OtherFlatConfig(BaseConfig):
+    oneValue: int
+    twoValue: str
+
+
+@pytest.fixture
+def config_folder(tmp_path: Path, monkeypatch):
+    monkeypatch.delenv("ENV", raising=False)
+    for env in ["dev", "test", "prod"]:
+        (tmp_path / f"{env}.yaml").write_text(f'oneValue: 1\ntwoValue: "{env}"')
+    return tmp_path
+
+
+def test_cache_per_class(config_folder: Path):
+    FlatConfig.register_folder(config_folder, default_env="prod")
+    FlatConfig.get()
+
+    assert OtherFlatConfig.__cache__ is not FlatConfig.__cache__
+    assert OtherFlatConfig.__cache__ is not BaseConfig.__cache__
+    assert "prod" not in OtherFlatConfig.__cache__
+
+
+def test_lru_eviction(config_folder: Path, monkeypatch):
+    FlatConfig.register_folder(config_folder, default_env="dev", cache_size=2)
+
+    for env in ["dev", "test", "dev", "prod"]:
+        monkeypatch.setenv("ENV", env)
+        FlatConfig.refresh_env()
+        assert FlatConfig.get().twoValue == env
+
+    assert FlatConfig.__cache__.keys() == ["dev", "prod"]
+    stats = FlatConfig.cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 3
+    assert stats.evictions == 1
+    assert stats.current_size == 2
+
+
+def test_ttl_expiration(config_folder: Path):
+    FlatConfig.register_folder(config_folder, default_env="prod", cache_ttl=0.05)
+
+    config = FlatConfig.get()
+    assert FlatConfig.get() is config
+    time.sleep(0.1)
+
+    assert FlatConfig.get() is not config
+    assert FlatConfig.cache_stats().expirations == 1
+
+
+def test_clear_cache(config_folder: Path):
+    FlatConfig.register_folder(config_folder, default_env="prod")
+    config = FlatConfig.get()
+
+    FlatConfig.clear_cache()
+
+    assert FlatConfig.get() is not config
+
+
+def test_config_cache_without_bounds():
+    cache = ConfigCache()
+    cache["prod"] = FlatConfig(oneValue=1, twoValue="prod")
+
+    assert cache.get("prod") is cache["prod"]
+    assert cache.get("dev") is None
+    assert cache.stats()[:2] == (1, 1)
@@ -0,0 +1,80 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.unit.config_model import RootConfig
+
+CONFIG_CONTENT = (
+    "rootValue: {root_value}\n"
+    "rangeValue: 5\n"
+    "childNode:\n"
+    '  testStr: "watched"\n'
+    "  testInt: 42\n"
+    "  testFloat: 42.42\n"
+    "  anyEnum: value2"
+)
+
+
+def _write(config_path: Path, content: str):
+    config_path.write_text(content)
+    # make sure the modification is visible even on file systems with a coarse timestamp resolution
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def watched_config(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.delenv("ENV", raising=False)
+    config_path = tmp_path / "prod.yaml"
+    config_path.write_text(CONFIG_CONTENT.format(root_value=1))
+    RootConfig.register_folder(tmp_path, default_env="prod", watch=True, poll_interval=3600)
+    yield config_path
+    RootConfig.stop_watching()
+
+
+def test_reload_on_change(watched_config: Path):
+    changes = []
+
+    def on_change(env, config, keys):
+        changes.append((env, config, keys))
+
+    RootConfig.subscribe(on_change)
+    assert RootConfig.get().rootValue == 1
+    _write(watched_config, CONFIG_CONTENT.format(root_value=2))
+    RootConfig.__watcher__.check()  # type: ignore[union-attr]
+    RootConfig.unsubscribe(on_change)
+
+    assert RootConfig.get().rootValue == 2
+    assert len(changes) == 1
+    assert changes[0][0] == "prod"
+    assert changes[0][1] is RootConfig.get()
+    assert changes[0][2] == {"rootValue"}
+
+
+def test_keep_last_good_config(watched_config: Path):
+    config = RootConfig.get()
+    _write(watched_config, CONFIG_CONTENT.format(root_value="not a number"))
+    RootConfig.__watcher__.check()  # type: ignore[union-attr]
+
+    assert RootConfig.get() is config
+
+
+def test_polling_thread(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.delenv("ENV", raising=False)
+    config_path = tmp_path / "prod.yaml"
+    config_path.write_text(CONFIG_CONTENT.format(root_value=1))
+    RootConfig.register_folder(tmp_path, default_env="prod", watch=True, poll_interval=0.01)
+    try:
+        assert RootConfig.get().rootValue == 1
+        _write(config_path, CONFIG_CONTENT.format(root_value=3))
+
+        deadline = time.monotonic() + 5
+        while RootConfig.get().rootValue != 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert RootConfig.get().rootValue == 3
+    finally:
+        RootConfig.stop_watching()
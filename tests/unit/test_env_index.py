@@ -0,0 +1,56 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from confme import ConfmeException
+from confme.core.env_index import EnvFileIndex
+
+
+def _touch(folder: Path, *names: str):
+    for name in names:
+        (folder / name).write_text("")
+
+
+def test_ranked_matching(tmp_path: Path):
+    _touch(tmp_path, "preprod.yaml", "my_prod_config.yaml", "prod.yaml", "production.yaml", "test_settings.yaml")
+    index = EnvFileIndex(tmp_path)
+
+    assert index.resolve("prod").name == "prod.yaml"
+    assert index.resolve("prod.yaml").name == "prod.yaml"
+    assert index.resolve("produc").name == "production.yaml"
+    assert index.resolve("test").name == "test_settings.yaml"
+    assert index.resolve("settings").name == "test_settings.yaml"
+    assert index.resolve("reprod").name == "preprod.yaml"
+
+
+def test_token_before_substring(tmp_path: Path):
+    _touch(tmp_path, "my_preprod_config.yaml", "my_prod_config.yaml")
+    index = EnvFileIndex(tmp_path)
+
+    assert index.resolve("prod").name == "my_prod_config.yaml"
+    assert index.resolve("preprod").name == "my_preprod_config.yaml"
+
+
+def test_strict_matching(tmp_path: Path):
+    _touch(tmp_path, "my_prod_config.yaml", "prod.yaml")
+    index = EnvFileIndex(tmp_path, strict=True)
+
+    assert index.resolve("prod").name == "prod.yaml"
+    assert index.resolve("my_prod_config.yaml").name == "my_prod_config.yaml"
+    with pytest.raises(ConfmeException):
+        index.resolve("my_prod")
+
+
+def test_refresh_on_folder_change(tmp_path: Path):
+    _touch(tmp_path, "my_prod_config.yaml")
+    index = EnvFileIndex(tmp_path)
+    assert index.resolve("prod").name == "my_prod_config.yaml"
+
+    _touch(tmp_path, "prod.yaml")
+    stat = tmp_path.stat()
+    os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert index.resolve("prod").name == "prod.yaml"
+    with pytest.raises(ConfmeException):
+        index.resolve("dev")
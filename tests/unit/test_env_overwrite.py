@@ -6,6 +6,7 @@ from os import path
 
 import pytest
 
+from confme.core.env_overwrite import env_overwrite
 from tests.unit.config_model import AnyEnum, RootConfig
 
 
@@ -56,3 +57,26 @@ def test_environment_overwrite_config(config_yaml: str):
 
     for v in ["++rootValue", "2", "++childNode.anyEnum", "value1"]:
         sys.argv.remove(v)
+
+
+def test_empty_environment(monkeypatch):
+    monkeypatch.setattr(os, "environ", {})
+
+    assert env_overwrite(RootConfig) == {}
+
+
+def test_environment_prefix_and_delimiter(config_yaml: str, monkeypatch):
+    class PrefixedConfig(RootConfig):
+        __env_prefix__ = "APP__"
+        __env_nested_delimiter__ = "__"
+
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.setenv("APP__ROOTVALUE", "3")
+    monkeypatch.setenv("APP__CHILDNODE__TESTINT", "33")
+    monkeypatch.setenv("childNode.testFloat", "1.5")
+
+    config = PrefixedConfig.load(config_yaml)
+
+    assert config.rootValue == 3
+    assert config.childNode.testInt == 33
+    assert config.childNode.testFloat == 42.42
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from confme import source_backend
+from confme.source_backend.file_cache import FileCache
+
+
+@pytest.fixture
+def config_yaml(tmp_path: Path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text('name: "cached"\nnested:\n  path: "%(here)s/data"\n  values: [1, 2]\n')
+    return config_path
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    source_backend.clear_cache()
+    yield
+    source_backend.clear_cache()
+
+
+def test_cache_hit(config_yaml: Path):
+    first = source_backend.parse_file(config_yaml)
+    second = source_backend.parse_file(config_yaml)
+
+    assert first == second
+    assert first is not second
+    assert source_backend.cache_info().hits == 1
+    assert source_backend.cache_info().misses == 1
+
+
+def test_cached_entry_not_corrupted(config_yaml: Path):
+    first = source_backend.parse_file(config_yaml)
+    first["nested"]["values"].append(3)
+    first["name"] = "changed"
+
+    second = source_backend.parse_file(config_yaml)
+
+    assert second["name"] == "cached"
+    assert second["nested"]["values"] == [1, 2]
+
+
+def test_empty_file_cached(tmp_path: Path):
+    config_path = tmp_path / "empty.yaml"
+    config_path.write_text("")
+
+    assert source_backend.parse_file(config_path) is None
+    assert source_backend.parse_file(config_path) is None
+    assert source_backend.cache_info().hits == 1
+    assert source_backend.cache_info().misses == 1
+
+
+def test_cache_invalidated_on_change(config_yaml: Path):
+    source_backend.parse_file(config_yaml)
+    config_yaml.write_text('name: "changed"\n')
+    stat = config_yaml.stat()
+    os.utime(config_yaml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert source_backend.parse_file(config_yaml) == {"name": "changed"}
+    assert source_backend.cache_info().misses == 2
+
+
+def test_cache_interpolation_option(config_yaml: Path):
+    interpolated = source_backend.parse_file(config_yaml)
+    raw = source_backend.parse_file(config_yaml, interpolate=False)
+
+    assert interpolated["nested"]["path"] == f"{config_yaml.parent.resolve()}/data"
+    assert raw["nested"]["path"] == "%(here)s/data"
+
+
+def test_content_hash_and_eviction(tmp_path: Path):
+    cache = FileCache(max_size=1, content_hash=True)
+    first_path = tmp_path / "first.yaml"
+    first_path.write_text("a: 1")
+    second_path = tmp_path / "second.yaml"
+    second_path.write_text("a: 2")
+
+    cache.put(cache.key(first_path), {"a": 1})
+    cache.put(cache.key(second_path), {"a": 2})
+
+    assert cache.get(cache.key(first_path)) is None
+    assert cache.get(cache.key(second_path)) == {"a": 2}
+    assert cache.info().current_size == 1
+
+    second_key = cache.key(second_path)
+    second_path.write_text("a: 3")
+    assert cache.key(second_path) != second_key
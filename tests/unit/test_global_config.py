@@ -55,10 +55,12 @@ def test_load_config_by_env(prod_config_yaml: str, test_config_yaml: str):
     assert root_config.childNode.testStr == "prod-env"
 
     os.environ["ENV"] = "test"
+    RootConfig.refresh_env()
     root_config = RootConfig.get()
     assert root_config.childNode.testStr == "test-env"
 
     os.environ["ENV"] = "prod"
+    RootConfig.refresh_env()
     root_config = RootConfig.get()
     assert root_config.childNode.testStr == "prod-env"
 
@@ -76,14 +78,34 @@ def test_load_config_by_env_strict(prod_config_yaml: str, test_config_yaml: str)
 
     # test with strict env (prod)
     os.environ["ENV"] = prod_exact_name
+    RootConfig.refresh_env()
     root_config = RootConfig.get()
     assert root_config.childNode.testStr == "prod-env"
 
     # test with strict env (test)
     os.environ["ENV"] = "test"
+    RootConfig.refresh_env()
     with pytest.raises(ConfmeException):
         _ = RootConfig.get()
 
     os.environ["ENV"] = test_exact_name
+    RootConfig.refresh_env()
     root_config = RootConfig.get()
     assert root_config.childNode.testStr == "test-env"
+
+
+def test_pinned_env(prod_config_yaml: str, test_config_yaml: str, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.delenv("ENV", raising=False)
+    RootConfig.register_folder(Path(prod_config_yaml).parent, default_env="prod")
+
+    assert RootConfig.get().childNode.testStr == "prod-env"
+
+    # the environment is pinned at first use
+    monkeypatch.setenv("ENV", "test")
+    assert RootConfig.get().childNode.testStr == "prod-env"
+    assert RootConfig.refresh_env() == "test"
+    assert RootConfig.get().childNode.testStr == "test-env"
+
+    RootConfig.pin_env("prod")
+    assert RootConfig.get().childNode.testStr == "prod-env"
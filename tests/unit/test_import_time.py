@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+# self time of all confme modules in microseconds. The budget is generous to keep the test stable on slow machines,
+# it is meant to catch heavy imports that are accidentally moved back to module level.
+IMPORT_BUDGET_US = 150_000
+LAZY_MODULES = ["argparse", "asyncio", "tabulate", "yaml", "tomllib", "confme.core.snapshot"]
+
+
+def _import_confme(code: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import confme\n{code}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_time_budget():
+    result = _import_confme()
+
+    self_time = 0
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        if name.strip().startswith("confme") and self_us.strip().isdigit():
+            self_time += int(self_us)
+
+    assert 0 < self_time < IMPORT_BUDGET_US
+
+
+def test_heavy_modules_are_imported_lazily():
+    result = _import_confme(f"import sys\nprint([m for m in {LAZY_MODULES!r} if m in sys.modules])")
+
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import pytest
+
+from confme import source_backend
+from confme.utils import instrumentation
+from confme.utils.instrumentation import LoadReport, LoadStatistics, add_observer, remove_observer
+from tests.unit.config_model import RootConfig
+
+CONFIG_CONTENT = """
+rootValue: 1
+rangeValue: 5
+childNode:
+  testStr: "%(here)s/test"
+  testInt: 42
+  testFloat: 42.42
+  anyEnum: value2
+"""
+
+
+@pytest.fixture
+def config_yaml(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    config_path = tmp_path / "prod.yaml"
+    config_path.write_text(CONFIG_CONTENT)
+    source_backend.clear_cache()
+    return config_path
+
+
+@pytest.fixture
+def reports():
+    collected: list[LoadReport] = []
+    add_observer(collected.append)
+    yield collected
+    remove_observer(collected.append)
+
+
+def test_load_report(config_yaml: Path, reports: list[LoadReport]):
+    RootConfig.load(config_yaml, argv=["++rootValue=2"])
+
+    assert len(reports) == 1
+    report = reports[0]
+    assert report.config_cls is RootConfig
+    assert report.path == str(config_yaml)
+    assert report.error is None
+    assert set(report.stages) == {
+        "env_overwrite",
+        "argument_overwrite",
+        "parse_file",
+        "interpolate",
+        "merge",
+        "validate",
+    }
+    assert report.bytes == len(CONFIG_CONTENT)
+    assert report.leaves == 6
+    assert report.duration >= sum(report.stages.values())
+
+
+def test_load_from_dict_report(reports: list[LoadReport], monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    RootConfig.load_from_dict(
+        {
+            "rootValue": 1,
+            "rangeValue": 5,
+            "childNode": {"testStr": "a", "testInt": 42, "testFloat": 42.42, "anyEnum": "value2"},
+        },
+        argv=[],
+    )
+
+    assert len(reports) == 1
+    assert reports[0].path is None
+    assert reports[0].bytes == 0
+    assert set(reports[0].stages) == {"env_overwrite", "argument_overwrite", "merge", "validate"}
+
+
+def test_get_reports_cache_misses(config_yaml: Path, reports: list[LoadReport], monkeypatch):
+    monkeypatch.setattr("sys.argv", ["program"])
+    RootConfig.register_folder(config_yaml.parent, default_env="prod")
+    RootConfig.pin_env("prod")
+
+    RootConfig.get()
+    RootConfig.get()
+
+    # the nested load is part of the report of get, the cache hit is not reported
+    assert len(reports) == 1
+    assert reports[0].env == "prod"
+    assert reports[0].path == str(config_yaml)
+    assert "validate" in reports[0].stages
+
+
+def test_failed_load_is_reported(tmp_path: Path, reports: list[LoadReport]):
+    config_path = tmp_path / "invalid.yaml"
+    config_path.write_text("rootValue: not a number\n")
+
+    with pytest.raises(Exception):  # noqa: B017
+        RootConfig.load(config_path, argv=[])
+
+    assert len(reports) == 1
+    assert reports[0].error is not None
+
+
+def test_failing_observer_is_logged(config_yaml: Path, reports: list[LoadReport], caplog):
+    def failing_observer(report: LoadReport):
+        raise RuntimeError("observer failed")
+
+    add_observer(failing_observer)
+    try:
+        config = RootConfig.load(config_yaml, argv=[])
+    finally:
+        remove_observer(failing_observer)
+
+    assert config.rootValue == 1
+    assert len(reports) == 1
+    assert "observer failed" in caplog.text
+
+
+def test_no_observer(config_yaml: Path):
+    assert instrumentation.current_report() is None
+    assert instrumentation.stage("parse_file") is instrumentation._NOOP
+    assert instrumentation.observe_load(RootConfig) is instrumentation._NOOP
+
+
+def test_load_statistics(config_yaml: Path):
+    statistics = LoadStatistics()
+    add_observer(statistics)
+    try:
+        for _ in range(3):
+            RootConfig.load(config_yaml, argv=[])
+    finally:
+        remove_observer(statistics)
+
+    summary = statistics.summary()
+    assert statistics.loads == 3
+    assert summary["total"].calls == 3
+    assert summary["validate"].calls == 3
+    assert summary["validate"].p50 <= summary["validate"].p99
+    # the file is parsed once and served from the parsed file cache afterwards
+    assert statistics.bytes == len(CONFIG_CONTENT)
+
+    statistics.reset()
+    assert statistics.summary() == {}
+
+
+def test_percentile():
+    ordered = [float(i) for i in range(1, 101)]
+
+    assert instrumentation._percentile(ordered, 0.5) == 50.0
+    assert instrumentation._percentile(ordered, 0.99) == 99.0
+    assert instrumentation._percentile([1.0], 0.99) == 1.0
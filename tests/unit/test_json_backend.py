@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from confme import source_backend
+from confme.source_backend import parser_registry
+from confme.source_backend.backend_json import JsonFileParser
+from tests.unit.config_model import AnyEnum, RootConfig
+
+CONFIG_CONTENT = {
+    "rootValue": 1,
+    "rangeValue": 5,
+    "childNode": {"testStr": "This is a test", "testInt": 42, "testFloat": 42.42, "anyEnum": "value2"},
+}
+
+
+@pytest.fixture
+def config_json(tmp_path: Path):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps(CONFIG_CONTENT))
+    return config_path
+
+
+@pytest.fixture
+def parsed_files(monkeypatch):
+    calls = []
+    parse_file = source_backend.parse_file
+
+    def counting_parse_file(*args, **kwargs):
+        calls.append(args[0])
+        return parse_file(*args, **kwargs)
+
+    monkeypatch.setattr(source_backend, "parse_file", counting_parse_file)
+    return calls
+
+
+def test_parse_json(config_json: Path):
+    assert source_backend.parse_file(config_json) == CONFIG_CONTENT
+
+
+def test_load_json_directly(config_json: Path, parsed_files: list, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+
+    config = RootConfig.load(config_json, argv=[])
+
+    assert parsed_files == []
+    assert config.childNode.anyEnum == AnyEnum.V2
+    assert config.childNode.password == "superSecureSecret"
+
+
+def test_load_json_with_overwrites(config_json: Path, parsed_files: list, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+
+    config = RootConfig.load(config_json, argv=["++rootValue=2"])
+
+    assert parsed_files == [config_json]
+    assert config.rootValue == 2
+
+
+def test_load_json_with_placeholders(tmp_path: Path, parsed_files: list, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    config_path = tmp_path / "config.json"
+    content = json.loads(json.dumps(CONFIG_CONTENT))
+    content["childNode"]["testStr"] = "%(here)s/test"
+    config_path.write_text(json.dumps(content))
+
+    config = RootConfig.load(config_path, argv=[])
+
+    assert parsed_files == [config_path]
+    assert config.childNode.testStr == f"{tmp_path.resolve()}/test"
+
+
+class CommentJsonFileParser(JsonFileParser):
+    def parse(self, file: IO[str]) -> dict[str, Any]:
+        return json.loads("".join(line for line in file if not line.lstrip().startswith("//")))
+
+
+def test_load_json_with_registered_parser(config_json: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.setattr(parser_registry, "_PARSERS", dict(parser_registry._PARSERS))
+    source_backend.register_parser(CommentJsonFileParser())
+    config_json.write_text("// comment\n" + config_json.read_text())
+
+    config = RootConfig.load(config_json, argv=[])
+
+    assert config.rootValue == 1
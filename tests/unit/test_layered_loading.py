@@ -0,0 +1,183 @@
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from confme import BaseConfig, ConfmeException, source_backend
+from confme.utils.dict_util import merge
+
+
+class DatabaseConfig(BaseConfig):
+    host: str
+    port: int
+
+
+class ServiceConfig(BaseConfig):
+    name: str
+    hosts: list[str]
+    database: DatabaseConfig
+
+
+BASE = "name: service\nhosts: [a, b]\ndatabase:\n  host: localhost\n  port: 5432\n"
+
+
+@pytest.fixture
+def config_folder(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr("sys.argv", ["program"])
+    source_backend.clear_cache()
+    (tmp_path / "base.yaml").write_text(BASE)
+    (tmp_path / "prod.yaml").write_text("hosts: [c]\ndatabase:\n  host: prod-db\n")
+    (tmp_path / "dev.yaml").write_text("name: dev-service\n")
+    return tmp_path
+
+
+def test_merge_does_not_modify_inputs():
+    base = {"a": {"x": 1, "y": [1, 2]}, "b": {"z": 3}}
+    update = {"a": {"x": 2}, "c": {"w": 4}}
+
+    result = merge(base, update)
+
+    assert result == {"a": {"x": 2, "y": [1, 2]}, "b": {"z": 3}, "c": {"w": 4}}
+    assert base == {"a": {"x": 1, "y": [1, 2]}, "b": {"z": 3}}
+    assert update == {"a": {"x": 2}, "c": {"w": 4}}
+    # unchanged subtrees are shared with the inputs
+    assert result["b"] is base["b"]
+    assert result["a"]["y"] is base["a"]["y"]
+    assert result["c"] is update["c"]
+
+
+def test_merge_without_changes_returns_base():
+    base = {"a": {"x": 1}}
+
+    assert merge(base, {}) is base
+    assert merge(base, {"a": {"x": 1}}) is base
+
+
+def test_merge_list_policy():
+    base = {"hosts": ["a", "b"]}
+
+    assert merge(base, {"hosts": ["c"]}) == {"hosts": ["c"]}
+    assert merge(base, {"hosts": ["c"]}, list_policy="append") == {"hosts": ["a", "b", "c"]}
+    assert base == {"hosts": ["a", "b"]}
+
+
+def test_merge_list_elements():
+    base = {"workers": [{"host": "a", "port": 1}, {"host": "b", "port": 2}]}
+
+    result = merge(base, {"workers": {"1": {"port": 3}, "2": {"host": "c"}}})
+
+    assert result == {"workers": [{"host": "a", "port": 1}, {"host": "b", "port": 3}, {"host": "c"}]}
+    assert result["workers"][0] is base["workers"][0]
+    assert base["workers"][1] == {"host": "b", "port": 2}
+    with pytest.raises(ConfmeException):
+        merge(base, {"workers": {"5": {"port": 3}}})
+    # mappings which are not keyed by indices replace the list
+    assert merge(base, {"workers": {"main": {"host": "c"}}}) == {"workers": {"main": {"host": "c"}}}
+    assert merge(base, {"workers": {"0": {"port": 3}, "main": {"host": "c"}}})["workers"] == {
+        "0": {"port": 3},
+        "main": {"host": "c"},
+    }
+
+
+def test_load_layers(config_folder: Path):
+    config = ServiceConfig.load([config_folder / "base.yaml", config_folder / "prod.yaml"], argv=["++name=cli"])
+
+    assert config.name == "cli"
+    assert config.hosts == ["c"]
+    assert config.database.host == "prod-db"
+    assert config.database.port == 5432
+
+
+def test_load_layers_append(config_folder: Path):
+    config = ServiceConfig.load([config_folder / "base.yaml", config_folder / "prod.yaml"], list_policy="append")
+
+    assert config.hosts == ["a", "b", "c"]
+
+
+def test_load_layers_unknown_policy(config_folder: Path):
+    with pytest.raises(ConfmeException):
+        ServiceConfig.load([config_folder / "base.yaml"], list_policy="prepend")  # type: ignore[arg-type]
+
+
+def test_load_from_dict_does_not_modify_content(monkeypatch):
+    content = {"name": "service", "hosts": ["a"], "database": {"host": "localhost", "port": 5432}}
+    monkeypatch.setenv("database.port", "1")
+
+    config = ServiceConfig.load_from_dict(content, argv=["++name=cli"])
+
+    assert config.name == "cli"
+    assert config.database.port == 1
+    assert content == {"name": "service", "hosts": ["a"], "database": {"host": "localhost", "port": 5432}}
+
+
+def test_base_layers_are_shared_between_environments(config_folder: Path):
+    ServiceConfig.register_folder(config_folder, base_layers=["base.yaml"], override_layers=["local.yaml"])
+
+    ServiceConfig.pin_env("prod")
+    prod = ServiceConfig.get()
+    ServiceConfig.pin_env("dev")
+    dev = ServiceConfig.get()
+
+    assert (prod.name, prod.database.host) == ("service", "prod-db")
+    assert (dev.name, dev.database.host, dev.hosts) == ("dev-service", "localhost", ["a", "b"])
+    # the base layer is parsed once and served from the parsed file cache for the second environment
+    assert source_backend.cache_info().hits == 1
+
+
+class ExtraConfig(BaseConfig):
+    name: str
+    extra: dict[str, Any]
+
+
+def test_layered_configs_do_not_alias_cache(config_folder: Path):
+    (config_folder / "base.yaml").write_text("name: service\nextra:\n  routes: [a]\n  tags:\n    t:\n      x: 1\n")
+    base = config_folder / "base.yaml"
+
+    prod = ExtraConfig.load([base, config_folder / "prod.yaml"])
+    prod.extra["routes"].append("EVIL")
+    prod.extra["tags"]["t"]["x"] = 999
+    prod.update_by_str("extra.tags", {"t": {"x": 998}})
+    prod.get_by_str("extra.tags")["t"]["x"] = 997
+
+    dev = ExtraConfig.load([base, config_folder / "dev.yaml"])
+    assert dev.extra == {"routes": ["a"], "tags": {"t": {"x": 1}}}
+    assert source_backend.cache_info().hits == 1
+
+
+def test_override_layers(config_folder: Path):
+    (config_folder / "local.yaml").write_text("database:\n  port: 1\n")
+    ServiceConfig.register_folder(config_folder, base_layers=["base.yaml"], override_layers=["local.yaml"])
+    ServiceConfig.pin_env("prod")
+
+    config = ServiceConfig.get()
+
+    assert config.database.host == "prod-db"
+    assert config.database.port == 1
+
+
+def test_preload_all_skips_layers(config_folder: Path):
+    (config_folder / "local.yaml").write_text("database:\n  port: 1\n")
+    ServiceConfig.register_folder(config_folder, base_layers=["base.yaml"], override_layers=["local.yaml"])
+
+    configs = ServiceConfig.preload_all()
+
+    assert sorted(configs) == ["dev", "prod"]
+    assert configs["dev"].database.port == 1
+
+
+def test_watcher_reloads_on_base_change(config_folder: Path):
+    ServiceConfig.register_folder(config_folder, base_layers=["base.yaml"], watch=True, poll_interval=3600)
+    try:
+        ServiceConfig.pin_env("prod")
+        assert ServiceConfig.get().database.port == 5432
+
+        base = config_folder / "base.yaml"
+        base.write_text(BASE.replace("5432", "6543"))
+        stat = base.stat()
+        os.utime(base, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        ServiceConfig.__watcher__.check()  # type: ignore[union-attr]
+
+        assert ServiceConfig.get().database.port == 6543
+    finally:
+        ServiceConfig.stop_watching()
@@ -0,0 +1,169 @@
+import pytest
+from pydantic import ValidationError, field_validator, model_validator
+
+from confme import BaseConfig
+from tests.unit.config_model import AnyEnum, ChildNode, RootConfig
+
+
+class DatabaseConfig(BaseConfig):
+    host: str
+    port: int
+
+
+class ServicesConfig(BaseConfig):
+    database: DatabaseConfig
+    cache: DatabaseConfig
+
+
+class AppConfig(BaseConfig):
+    name: str
+    services: ServicesConfig
+
+
+class CheckedServicesConfig(BaseConfig):
+    database: DatabaseConfig
+    cache: DatabaseConfig
+
+    @model_validator(mode="after")
+    def check_ports(self):
+        if self.database.port == self.cache.port:
+            raise ValueError("database and cache need different ports")
+        return self
+
+
+class CheckedAppConfig(BaseConfig):
+    name: str
+    services: ServicesConfig
+
+    @field_validator("services")
+    @classmethod
+    def check_services(cls, services: ServicesConfig) -> ServicesConfig:
+        if services.database.host == "forbidden":
+            raise ValueError("forbidden database host")
+        return services
+
+
+@pytest.fixture
+def app_content():
+    return {
+        "name": "app",
+        "services": {
+            "database": {"host": "db", "port": 5432},
+            "cache": {"host": "cache", "port": "not a number"},
+        },
+    }
+
+
+def test_sections_validated_on_access(app_content: dict):
+    config = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+    assert config.name == "app"
+    assert "services" not in config.__dict__
+
+    services = config.services
+    assert config.services is services
+    assert services.database.port == 5432
+    assert "cache" not in services.__dict__
+
+    with pytest.raises(ValidationError):
+        _ = services.cache
+
+
+def test_validate_all(app_content: dict):
+    config = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+    with pytest.raises(ValidationError):
+        config.validate_all()
+
+
+def test_root_fields_validated_eagerly(app_content: dict):
+    app_content["name"] = {"not": "a string"}
+
+    with pytest.raises(ValidationError):
+        AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+
+def test_lazy_config_equals_eager_config(monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    content = {
+        "rootValue": 1,
+        "rangeValue": 5,
+        "childNode": {"testStr": "This is a test", "testInt": 42, "testFloat": 42.42, "anyEnum": "value2"},
+    }
+
+    lazy_config = RootConfig.load_from_dict(dict(content), argv=[], lazy=True)
+    eager_config = RootConfig.load_from_dict(dict(content), argv=[])
+
+    assert lazy_config.model_dump() == eager_config.model_dump()
+    assert isinstance(lazy_config.childNode, ChildNode)
+    assert lazy_config.childNode.anyEnum == AnyEnum.V2
+    assert lazy_config.get_flat_repr() == eager_config.get_flat_repr()
+
+
+def test_copies_have_own_pending_sections(app_content: dict):
+    app_content["services"]["cache"]["port"] = 6379
+    config = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+    copied = config.model_copy()
+    assert copied.services.database.host == "db"
+    assert config.services.database.host == "db"
+    assert copied.services == config.services
+
+    deep_copied = AppConfig.load_from_dict(app_content, argv=[], lazy=True).model_copy(deep=True)
+    assert deep_copied.services.cache.port == 6379
+
+
+def test_lazy_equals_eager_and_repr(app_content: dict):
+    app_content["services"]["cache"]["port"] = 6379
+    eager = AppConfig.load_from_dict(app_content, argv=[])
+
+    assert AppConfig.load_from_dict(app_content, argv=[], lazy=True) == eager
+    assert eager == AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+    assert repr(AppConfig.load_from_dict(app_content, argv=[], lazy=True)) == repr(eager)
+
+
+def test_repr_shows_invalid_sections_raw(app_content: dict):
+    config = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+    assert "not a number" in repr(config.services)
+
+
+def test_assigned_sections_not_pending(app_content: dict):
+    app_content["services"]["cache"]["port"] = 6379
+    eager = AppConfig.load_from_dict(app_content, argv=[])
+
+    config = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+    config.update_by_str("services", eager.services.model_copy())
+    assert config._lazy_sections is None
+    assert config == eager
+    assert repr(config) == repr(eager)
+
+    services = AppConfig.load_from_dict(app_content, argv=[], lazy=True).services
+    services.cache = DatabaseConfig(host="other", port=1)
+    assert services._lazy_sections == {"database": app_content["services"]["database"]}
+    assert repr(services).count("cache=") == 1
+    assert services.validate_all()._lazy_sections is None
+    assert services.cache.host == "other"
+
+
+def test_classes_with_validators_validated_eagerly(app_content: dict):
+    app_content["services"]["cache"]["port"] = 5432
+    config = CheckedAppConfig.load_from_dict(app_content, argv=[], lazy=True)
+    assert config._lazy_sections is None
+    assert config.services.cache.port == 5432
+
+    with pytest.raises(ValidationError, match="different ports"):
+        CheckedServicesConfig.load_from_dict(app_content["services"], argv=[], lazy=True)
+
+    app_content["services"]["database"]["host"] = "forbidden"
+    with pytest.raises(ValidationError, match="forbidden database host"):
+        CheckedAppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+
+def test_invalid_pending_sections_not_equal(app_content: dict):
+    config = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+    other = AppConfig.load_from_dict(app_content, argv=[], lazy=True)
+
+    assert config == config
+    assert config != other
+    assert other != config
@@ -0,0 +1,138 @@
+import sys
+from typing import Optional
+
+from pydantic import Field, create_model
+
+from confme import BaseConfig
+from confme.utils.typing import get_layout
+from tests.unit.config_model import FlatConfig, RootConfig
+
+
+def test_layout_parameters():
+    layout = get_layout(RootConfig)
+
+    assert layout.parameters == [
+        "rootValue",
+        "rangeValue",
+        "childNode.testStr",
+        "childNode.testInt",
+        "childNode.testFloat",
+        "childNode.testOptional",
+        "childNode.password",
+        "childNode.anyEnum",
+    ]
+    assert layout.split("childNode.testInt") == ["childNode", "testInt"]
+    assert layout.split("not.known") == ["not", "known"]
+
+
+def test_layout_is_cached_per_class():
+    assert get_layout(RootConfig) is get_layout(RootConfig)
+    assert get_layout(RootConfig) is not get_layout(FlatConfig)
+
+
+def test_layout_recompiled_for_redefined_class():
+    class RedefinedConfig(BaseConfig):
+        value: int
+
+    first_layout = get_layout(RedefinedConfig)
+
+    # same name, different fields
+    redefined = create_model("RedefinedConfig", __base__=BaseConfig, value=(int, ...), other=(str, ...))
+
+    assert get_layout(redefined) is not first_layout
+    assert get_layout(redefined).parameters == ["value", "other"]
+
+
+class WorkerConfig(BaseConfig):
+    host: str
+    port: int
+
+
+class DatabaseConfig(BaseConfig):
+    host: str
+
+
+class TreeConfig(BaseConfig):
+    value: int
+    child: Optional["TreeConfig"] = None
+
+
+class ContainerConfig(BaseConfig):
+    database: Optional[DatabaseConfig] = None
+    workers: list[WorkerConfig]
+    shards: dict[str, WorkerConfig] = {}
+    ports: list[int] = []
+    tree: Optional[TreeConfig] = None
+
+
+def test_layout_containers():
+    layout = get_layout(ContainerConfig)
+
+    assert layout.dynamic
+    assert layout.parameters == ["database.host", "workers", "shards", "ports", "tree.value"]
+    assert layout.resolve(["workers", "0", "host"]) is not None
+    assert layout.resolve(["workers", "first", "host"]) is None
+    assert layout.resolve(["shards", "eu", "port"]) is not None
+    assert layout.resolve(["ports", "1"]) is not None
+    assert layout.resolve(["tree", "child", "child", "value"]) is not None
+    assert layout.resolve(["WORKERS", "0", "HOST"], casefold=True)[0] == ["workers", "0", "host"]  # type: ignore[index]
+
+
+def test_container_overwrite(monkeypatch):
+    config_content = {
+        "workers": [{"host": "first", "port": 1}, {"host": "second", "port": 2}],
+        "shards": {"eu": {"host": "eu-host", "port": 3}},
+        "tree": {"value": 1, "child": {"value": 2}},
+    }
+    monkeypatch.setenv("workers.1.host", "env-host")
+    monkeypatch.setenv("tree.child.value", "3")
+    monkeypatch.setattr(sys, "argv", ["test", "++shards.eu.port=4", "++workers.0.port", "5", "++database.host", "db"])
+
+    config = ContainerConfig.load_from_dict(config_content)
+
+    assert config.workers[0].port == 5
+    assert config.workers[1].host == "env-host"
+    assert config.shards["eu"].port == 4
+    assert config.tree.child.value == 3  # type: ignore[union-attr]
+    assert config.database.host == "db"  # type: ignore[union-attr]
+
+
+def test_container_overwrite_keeps_key_case(monkeypatch):
+    config_content = {"workers": [], "shards": {"EU": {"host": "eu-host", "port": 3}}}
+    monkeypatch.setenv("SHARDS.EU.PORT", "5")
+    monkeypatch.setenv("shards.Us.host", "us-host")
+    monkeypatch.setenv("shards.Us.port", "6")
+
+    config = ContainerConfig.load_from_dict(config_content, argv=[])
+
+    assert config.shards["EU"].port == 5
+    assert (config.shards["Us"].host, config.shards["Us"].port) == ("us-host", 6)
+    assert set(config.shards) == {"EU", "Us"}
+
+
+class AliasedDatabaseConfig(BaseConfig):
+    host: str = Field(alias="hostName")
+    port: int = Field(validation_alias="portNumber", default=0)
+
+
+class AliasedConfig(BaseConfig):
+    db: AliasedDatabaseConfig
+
+
+def test_aliased_fields(monkeypatch):
+    layout = get_layout(AliasedConfig)
+    assert layout.parameters == ["db.hostName", "db.portNumber"]
+
+    monkeypatch.setenv("db.hostName", "fromenv")
+    monkeypatch.setattr(sys, "argv", ["test", "++db.portNumber", "5"])
+    config = AliasedConfig.load_from_dict({"db": {"hostName": "file"}})
+
+    assert config.db.host == "fromenv"
+    assert config.db.port == 5
+
+    # updates address fields by attribute name or alias
+    config.update_by_str("db.host", "updated")
+    assert config.db.host == "updated"
+    config.update_by_str("db.hostName", "aliased")
+    assert config.db.host == "aliased"
+    assert config.get_by_str("db.port") == 5
@@ -3,9 +3,12 @@ import os
 import sys
 import uuid
 from os import path
+from typing import Optional
 
 import pytest
 
+from confme import BaseConfig
+from confme.core.argument_overwrite import parse_arguments
 from tests.unit.config_model import AnyEnum, RootConfig
 
 
@@ -47,3 +50,37 @@ def test_load_config(config_yaml: str):
 
     for v in ["++rootValue", "2", "++childNode.anyEnum", "value1"]:
         sys.argv.remove(v)
+
+
+def test_injected_arguments(config_yaml: str):
+    os.environ["highSecure"] = "superSecureSecret"
+
+    root_config = RootConfig.load(config_yaml, argv=["++rootValue=3", "++childNode.testStr", "42", "++unknown", "1"])
+
+    assert root_config.rootValue == 3
+    assert root_config.childNode.testStr == "42"
+    assert root_config.childNode.testInt == 42
+
+
+def test_parse_arguments():
+    argv = ["positional", "++a.b=1=2", "++c", "value", "++d", "++e", "-5"]
+
+    arguments = parse_arguments(argv)
+
+    assert arguments == {"a.b": "1=2", "c": "value", "e": "-5"}
+    assert parse_arguments(list(argv)) is arguments
+
+
+def test_typed_coercion():
+    class CoercedConfig(BaseConfig):
+        ports: list[int]
+        limit: Optional[int]
+        name: str
+
+    config = CoercedConfig.load_from_dict(
+        {"ports": [], "limit": 1, "name": "x"}, argv=["++ports=[80, 443]", "++limit=null", "++name=123"]
+    )
+
+    assert config.ports == [80, 443]
+    assert config.limit is None
+    assert config.name == "123"
@@ -0,0 +1,104 @@
+import importlib.metadata
+from importlib.metadata import EntryPoint
+from pathlib import Path
+from typing import IO, Any
+
+import pytest
+
+from confme import ConfmeException, source_backend
+from confme.source_backend import parser_registry
+from confme.source_backend.backend_base import BaseFileParser
+
+
+class KeyValueFileParser(BaseFileParser):
+    def get_endings(self) -> list[str]:
+        return [".kv"]
+
+    def parse(self, file: IO[str]) -> dict[str, Any]:
+        return dict(line.strip().split("=", 1) for line in file if line.strip())
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(parser_registry, "_PARSERS", dict(parser_registry._PARSERS))
+    monkeypatch.setattr(parser_registry, "_entry_points_loaded", False)
+    source_backend.clear_cache()
+    yield
+    source_backend.clear_cache()
+
+
+@pytest.fixture
+def kv_file(tmp_path: Path):
+    file_path = tmp_path / "config.kv"
+    file_path.write_text("host=localhost\npath=%(here)s/data\n")
+    return file_path
+
+
+def test_unknown_ending(tmp_path: Path):
+    file_path = tmp_path / "config.unknown"
+    file_path.write_text("")
+
+    with pytest.raises(ConfmeException, match="File ending .unknown not known"):
+        source_backend.parse_file(file_path)
+
+
+def test_register_parser(kv_file: Path):
+    source_backend.register_parser(KeyValueFileParser())
+
+    content = source_backend.parse_file(kv_file)
+
+    assert content == {"host": "localhost", "path": f"{kv_file.parent.resolve()}/data"}
+    assert ".kv" in source_backend.registered_endings()
+
+
+def test_register_parser_reference(kv_file: Path):
+    source_backend.register_parser(f"{__name__}:KeyValueFileParser", endings=["kv", ".keyvalue"])
+    assert parser_registry._PARSERS[".kv"] == f"{__name__}:KeyValueFileParser"
+
+    parser = source_backend.get_parser(kv_file)
+
+    assert isinstance(parser, KeyValueFileParser)
+    # both endings share the parser instance once it is imported
+    assert parser_registry._PARSERS[".keyvalue"] is parser
+
+
+def test_register_parser_reference_requires_endings():
+    with pytest.raises(ConfmeException):
+        source_backend.register_parser(f"{__name__}:KeyValueFileParser")
+
+
+def test_invalid_parser_reference(kv_file: Path):
+    source_backend.register_parser("confme.not_existing:Parser", endings=[".kv"])
+
+    with pytest.raises(ConfmeException, match="Not able to load parser"):
+        source_backend.get_parser(kv_file)
+
+
+def test_entry_point_parser(kv_file: Path, monkeypatch):
+    entry_point = EntryPoint(name="kv", value=f"{__name__}:KeyValueFileParser", group=parser_registry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [entry_point])
+
+    assert source_backend.parse_file(kv_file, interpolate=False)["host"] == "localhost"
+
+
+def test_entry_point_does_not_replace_builtin(monkeypatch):
+    entry_point = EntryPoint(
+        name="yaml", value=f"{__name__}:KeyValueFileParser", group=parser_registry.ENTRY_POINT_GROUP
+    )
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: [entry_point])
+
+    assert not isinstance(source_backend.get_parser("config.yaml"), KeyValueFileParser)
+
+
+def test_file_parser_deprecated():
+    source_backend.register_parser(KeyValueFileParser())
+
+    with pytest.warns(DeprecationWarning):
+        file_parser = source_backend.FILE_PARSER
+
+    assert [type(parser).__name__ for parser in file_parser] == [
+        "JsonFileParser",
+        "KeyValueFileParser",
+        "TomlFileParser",
+        "YamlFileParser",
+    ]
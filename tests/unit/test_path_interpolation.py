@@ -6,7 +6,8 @@ from pathlib import Path
 import pytest
 
 from confme import BaseConfig
-from confme.utils.path_interpolation import _interpolate_string, interpolate_paths
+from confme.utils import path_interpolation
+from confme.utils.path_interpolation import _interpolate_string, interpolate_paths, register_placeholder
 
 
 class PathConfig(BaseConfig):
@@ -204,3 +205,68 @@ def test_relative_path_to_config_file(tmp_path: Path, monkeypatch):
 
     assert config.script_location == f"{tmp_path.resolve()}/scripts"
     assert config.data_dir == f"{tmp_path.resolve()}/data"
+
+
+def test_home_and_cwd_placeholders(tmp_path: Path, monkeypatch):
+    """Test that %(home)s and %(cwd)s are replaced."""
+    monkeypatch.chdir(tmp_path)
+    result = interpolate_paths({"home": "%(home)s/.app", "cwd": "%(cwd)s/data"}, tmp_path)
+
+    assert result["home"] == f"{Path.home()}/.app"
+    assert result["cwd"] == f"{Path.cwd()}/data"
+
+
+@pytest.fixture
+def placeholder_registry(monkeypatch):
+    """Restores the registered placeholders after the test."""
+    monkeypatch.setattr(path_interpolation, "_PLACEHOLDERS", dict(path_interpolation._PLACEHOLDERS))
+
+
+def test_registered_placeholder(tmp_path: Path, placeholder_registry):
+    """Test that custom placeholders can be registered."""
+    register_placeholder("parent", lambda config_dir: str(config_dir.resolve().parent))
+
+    result = interpolate_paths({"path": "%(parent)s/shared"}, tmp_path)
+
+    assert result["path"] == f"{tmp_path.resolve().parent}/shared"
+
+
+def test_unchanged_subtrees_are_shared(tmp_path: Path):
+    """Test that the input is not modified and unchanged subtrees are shared."""
+    config = {
+        "changed": {"path": "%(here)s/data"},
+        "unchanged": {"path": "/absolute/path", "values": [1, 2]},
+        "unknown": "%(unknown)s/path",
+    }
+    result = interpolate_paths(config, tmp_path)
+
+    assert config["changed"]["path"] == "%(here)s/data"
+    assert result["changed"]["path"] == f"{tmp_path.resolve()}/data"
+    assert result["unchanged"] is config["unchanged"]
+    assert result["unknown"] is config["unknown"]
+    assert interpolate_paths(config["unchanged"], tmp_path) is config["unchanged"]
+
+
+class CachedPathConfig(BaseConfig):
+    cwd_path: str
+    region_path: str
+
+
+def test_cached_file_interpolated_per_load(tmp_path: Path, monkeypatch, placeholder_registry):
+    """Test that cached files are interpolated again if the process state of the placeholders changes."""
+    config_path = tmp_path / f"{uuid.uuid4()}.yaml"
+    config_path.write_text('cwd_path: "%(cwd)s/out"\nregion_path: "%(cached_region)s/data"\n')
+    first_dir, second_dir = tmp_path / "a", tmp_path / "b"
+    first_dir.mkdir()
+    second_dir.mkdir()
+
+    monkeypatch.chdir(first_dir)
+    config = CachedPathConfig.load(config_path)
+    assert config.cwd_path == f"{first_dir}/out"
+    assert config.region_path == "%(cached_region)s/data"
+
+    monkeypatch.chdir(second_dir)
+    register_placeholder("cached_region", lambda config_dir: "eu")
+    config = CachedPathConfig.load(config_path)
+    assert config.cwd_path == f"{second_dir}/out"
+    assert config.region_path == "eu/data"
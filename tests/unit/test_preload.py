@@ -0,0 +1,86 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from confme import PreloadError
+from tests.unit.config_model import RootConfig
+
+
+def _config(test_str: str) -> str:
+    return (
+        "rootValue: 1\n"
+        "rangeValue: 5\n"
+        "childNode:\n"
+        f'  testStr: "{test_str}"\n'
+        "  testInt: 42\n"
+        "  testFloat: 42.42\n"
+        "  anyEnum: value2"
+    )
+
+
+@pytest.fixture
+def config_folder(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.setattr("sys.argv", ["program"])
+    (tmp_path / "prod.yaml").write_text(_config("prod-env"))
+    (tmp_path / "dev.yaml").write_text(_config("dev-env"))
+    (tmp_path / "test.json").write_text(
+        '{"rootValue": 1, "rangeValue": 5, "childNode": {"testStr": "test-env", "testInt": 42, "testFloat": 42.42, '
+        '"anyEnum": "value2"}}'
+    )
+    # files without a registered parser are not considered as environments
+    (tmp_path / "README.md").write_text("# configuration files")
+    return tmp_path
+
+
+def test_preload_all(config_folder: Path):
+    RootConfig.register_folder(config_folder)
+
+    configs = RootConfig.preload_all()
+
+    assert {env: c.childNode.testStr for env, c in configs.items()} == {
+        "dev": "dev-env",
+        "prod": "prod-env",
+        "test": "test-env",
+    }
+    RootConfig.pin_env("dev")
+    assert RootConfig.get() is configs["dev"]
+    assert RootConfig.cache_stats().hits == 1
+
+
+def test_preload_all_reports_all_errors(config_folder: Path):
+    (config_folder / "broken.yaml").write_text("rootValue: [")
+    (config_folder / "invalid.yaml").write_text("rootValue: not a number")
+    RootConfig.register_folder(config_folder)
+
+    with pytest.raises(PreloadError) as exc_info:
+        RootConfig.preload_all()
+
+    assert set(exc_info.value.errors) == {"broken", "invalid"}
+    assert "broken" in str(exc_info.value) and "invalid" in str(exc_info.value)
+    # valid environments are cached nevertheless
+    assert sorted(RootConfig.__cache__.keys()) == ["dev", "prod", "test"]
+
+
+def test_preload_all_process_pool(config_folder: Path):
+    RootConfig.register_folder(config_folder)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        configs = RootConfig.preload_all(executor=executor)
+
+    assert configs["prod"].childNode.testStr == "prod-env"
+    RootConfig.pin_env("prod")
+    assert RootConfig.get() is configs["prod"]
+
+
+def test_preload_all_caches_resolved_env(config_folder: Path, monkeypatch):
+    (config_folder / "prod.yaml").rename(config_folder / "my_prod_config.yaml")
+    monkeypatch.setenv("ENV", "prod")
+    RootConfig.register_folder(config_folder)
+
+    configs = RootConfig.preload_all()
+
+    assert "my_prod_config" in configs
+    assert RootConfig.get() is configs["my_prod_config"]
+    assert RootConfig.cache_stats().misses == 0
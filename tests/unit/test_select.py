@@ -0,0 +1,69 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from confme import BaseConfig, ConfmeException
+from confme.source_backend.backend_yaml import YamlFileParser
+
+
+class ReplicaConfig(BaseConfig):
+    host: str
+    port: int
+    data_dir: str
+
+
+class BoundReplicaConfig(ReplicaConfig):
+    __config_select__ = "database.replicas"
+
+
+@pytest.fixture
+def config_yaml(tmp_path: Path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        "service: !!python/name:os.system\n"
+        "database:\n"
+        "  replicas:\n"
+        "    host: replica\n"
+        "    port: 5432\n"
+        '    data_dir: "%(here)s/data"\n'
+    )
+    return config_path
+
+
+def test_load_subtree(config_yaml: Path):
+    config = ReplicaConfig.load(config_yaml, argv=[], select="database.replicas")
+
+    assert config.host == "replica"
+    assert config.port == 5432
+    assert config.data_dir == f"{config_yaml.parent.resolve()}/data"
+
+
+def test_bound_subtree(config_yaml: Path):
+    assert BoundReplicaConfig.load(config_yaml, argv=[]).host == "replica"
+
+
+def test_subtree_overwrites_keep_full_path(config_yaml: Path, monkeypatch):
+    monkeypatch.setenv("database.replicas.port", "6543")
+    monkeypatch.setenv("host", "not-selected")
+
+    config = BoundReplicaConfig.load(config_yaml, argv=["++database.replicas.host=other", "++port=1"])
+
+    assert config.host == "other"
+    assert config.port == 6543
+
+
+def test_missing_subtree(config_yaml: Path):
+    with pytest.raises(ConfmeException, match="Path database.primary not found"):
+        ReplicaConfig.load(config_yaml, argv=[], select="database.primary")
+    with pytest.raises(ConfmeException, match="Path database.nope not found"):
+        ReplicaConfig.load(config_yaml, argv=[], select="database.nope.deeper")
+
+
+def test_yaml_subtree_with_merge_keys():
+    content = "defaults: &defaults\n  port: 1\nreplica:\n  <<: *defaults\n  host: replica\n"
+
+    parser = YamlFileParser()
+
+    assert parser.parse_subtree(io.StringIO(content), ["replica"]) == {"port": 1, "host": "replica"}
+    assert parser.parse_subtree(io.StringIO(content), ["replica", "port"]) == 1
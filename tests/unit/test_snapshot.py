@@ -0,0 +1,131 @@
+import uuid
+from pathlib import Path
+
+import pytest
+from pydantic import create_model
+
+from confme import BaseConfig
+from confme.core import snapshot
+from confme.utils import path_interpolation
+from confme.utils.path_interpolation import register_placeholder
+from tests.unit.config_model import AnyEnum, ChildNode, RootConfig
+
+
+@pytest.fixture
+def config_yaml(tmp_path: Path):
+    config_path = tmp_path / f"{uuid.uuid4()}.yaml"
+    config_path.write_text(
+        "rootValue: 1\n"
+        "rangeValue: 5\n"
+        "childNode:\n"
+        '  testStr: "%(here)s/test"\n'
+        "  testInt: 42\n"
+        "  testFloat: 42.42\n"
+        "  anyEnum: value2"
+    )
+    return config_path
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    calls = []
+    validate = BaseConfig._validate.__func__  # type: ignore[attr-defined]
+
+    def counting_validate(cls, config_content, lazy):
+        calls.append(cls)
+        return validate(cls, config_content, lazy)
+
+    monkeypatch.setattr(BaseConfig, "_validate", classmethod(counting_validate))
+    return calls
+
+
+def test_snapshot_hit(config_yaml: Path, tmp_path: Path, validations: list, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    snapshot_dir = tmp_path / "snapshots"
+
+    first = RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir)
+    second = RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir)
+
+    assert len(validations) == 1
+    assert second == first
+    assert isinstance(second.childNode, ChildNode)
+    assert second.childNode.anyEnum == AnyEnum.V2
+    assert second.childNode.testStr == f"{config_yaml.parent.resolve()}/test"
+
+
+def test_secrets_not_stored(config_yaml: Path, tmp_path: Path, monkeypatch):
+    snapshot_dir = tmp_path / "snapshots"
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir)
+
+    for file in snapshot_dir.iterdir():
+        assert b"superSecureSecret" not in file.read_bytes()
+
+    monkeypatch.setenv("highSecure", "rotatedSecret")
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).childNode.password == "rotatedSecret"
+
+
+def test_snapshot_invalidation(config_yaml: Path, tmp_path: Path, validations: list, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    snapshot_dir = tmp_path / "snapshots"
+    RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir)
+
+    # argument overwrite changes
+    assert RootConfig.load(config_yaml, argv=["++rootValue=2"], snapshot_dir=snapshot_dir).rootValue == 2
+    # environment overwrite changes
+    monkeypatch.setenv("childNode.testInt", "7")
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).childNode.testInt == 7
+    # file content changes
+    config_yaml.write_text(config_yaml.read_text().replace("rootValue: 1", "rootValue: 3"))
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).rootValue == 3
+
+    assert len(validations) == 4
+
+
+def test_snapshot_invalidated_by_placeholders(config_yaml: Path, tmp_path: Path, validations: list, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.setattr(path_interpolation, "_PLACEHOLDERS", dict(path_interpolation._PLACEHOLDERS))
+    config_yaml.write_text(config_yaml.read_text().replace("%(here)s", "%(region)s"))
+    snapshot_dir = tmp_path / "snapshots"
+
+    register_placeholder("region", lambda config_dir: "eu")
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).childNode.testStr == "eu/test"
+    register_placeholder("region", lambda config_dir: "us")
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).childNode.testStr == "us/test"
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).childNode.testStr == "us/test"
+
+    assert len(validations) == 2
+
+
+def test_corrupt_snapshot_ignored(config_yaml: Path, tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    snapshot_dir = tmp_path / "snapshots"
+    RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir)
+    for file in snapshot_dir.iterdir():
+        file.write_bytes(b"corrupt")
+
+    assert RootConfig.load(config_yaml, argv=[], snapshot_dir=snapshot_dir).rootValue == 1
+
+
+def test_schema_fingerprint_changes():
+    class FirstConfig(BaseConfig):
+        value: int
+
+    first = snapshot.schema_fingerprint(FirstConfig)
+
+    # same name, different field type
+    redefined = create_model("FirstConfig", __base__=BaseConfig, value=(str, ...))
+
+    assert snapshot.schema_fingerprint(redefined) != first
+    assert snapshot.schema_fingerprint(RootConfig) == snapshot.schema_fingerprint(RootConfig)
+
+
+def test_unwritable_snapshot_dir_ignored(config_yaml: Path, tmp_path: Path, monkeypatch, caplog):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+
+    config = RootConfig.load(config_yaml, argv=[], snapshot_dir=not_a_dir / "snapshots")
+
+    assert config.rootValue == 1
+    assert "Not able to write configuration snapshot" in caplog.text
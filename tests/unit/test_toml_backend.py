@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import pytest
+
+from confme import source_backend
+from tests.unit.config_model import AnyEnum, RootConfig
+
+
+@pytest.fixture
+def config_toml(tmp_path: Path):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        "rootValue = 1\n"
+        "rangeValue = 5\n"
+        "\n"
+        "[childNode]\n"
+        'testStr = "%(here)s/test"\n'
+        "testInt = 42\n"
+        "testFloat = 42.42\n"
+        'anyEnum = "value2"\n'
+    )
+    return config_path
+
+
+def test_parse_toml(config_toml: Path):
+    content = source_backend.parse_file(config_toml, interpolate=False)
+
+    assert content["rootValue"] == 1
+    assert content["childNode"]["testStr"] == "%(here)s/test"
+
+
+def test_load_toml(config_toml: Path, monkeypatch):
+    monkeypatch.setenv("highSecure", "superSecureSecret")
+    monkeypatch.setenv("childNode.testInt", "7")
+
+    config = RootConfig.load(config_toml, argv=["++rootValue=2"])
+
+    assert config.rootValue == 2
+    assert config.childNode.testInt == 7
+    assert config.childNode.testStr == f"{config_toml.parent.resolve()}/test"
+    assert config.childNode.anyEnum == AnyEnum.V2
+
+
+def test_load_toml_subtree(config_toml: Path):
+    content = source_backend.parse_file(config_toml, select=["childNode", "testInt"])
+
+    assert content == 42